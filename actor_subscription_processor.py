@@ -2,7 +2,6 @@
 
 import json
 import time
-import re
 from datetime import datetime, timedelta
 import logging
 from typing import Optional, Dict, Any, List, Set, Callable
@@ -13,6 +12,7 @@ import tmdb_handler
 import emby_handler
 from db_handler import get_db_connection # ★★★ 核心修改：导入新的数据库连接函数
 import moviepilot_handler
+from utils import contains_chinese
 
 logger = logging.getLogger(__name__)
 
@@ -208,7 +208,6 @@ class ActorSubscriptionProcessor:
         grace_period_months = 6
         six_months_ago = datetime.now() - timedelta(days=grace_period_months * 30)
         grace_period_end_date_str = six_months_ago.strftime('%Y-%m-%d')
-        chinese_char_regex = re.compile(r'[\u4e00-\u9fff]')
 
         for work in works:
             media_id = work.get('id')
@@ -241,7 +240,7 @@ class ActorSubscriptionProcessor:
                         continue
             
             title = work.get('title') or work.get('name', '')
-            if not chinese_char_regex.search(title):
+            if not contains_chinese(title):
                 logger.trace(f"  -> 过滤作品: '{title}' (排除无中文片名)。")
                 continue
             
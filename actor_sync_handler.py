@@ -2,15 +2,45 @@
 
 import time
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 import threading
+import concurrent.futures
 # 导入必要的模块
 import emby_handler
 import logging
 from db_handler import get_db_connection as get_central_db_connection
-from db_handler import ActorDBManager
+from db_handler import ActorDBManager, relax_commit_durability
+from utils import to_stripped_str
 logger = logging.getLogger(__name__)
 
+# Emby ProviderIds (键名小写) -> upsert_person_batch 所需字段
+_PROVIDER_ID_FIELDS = {"tmdb": "tmdb_id", "imdb": "imdb_id", "douban": "douban_id"}
+
+def _prefetch_batches(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[List[Dict[str, Any]]]:
+    """
+    在后台线程中提前拉取下一批，使 Emby 的网络请求与当前批次的数据库写入重叠进行。
+    内存中最多同时持有两批数据；底层生成器始终只在同一时刻被一个线程推进。
+    """
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    future = None
+    try:
+        future = executor.submit(next, batches, None)
+        while True:
+            batch = future.result()
+            if batch is None:
+                return
+            future = executor.submit(next, batches, None)
+            yield batch
+    finally:
+        # 中途停止或出错时：尚未开始的预取直接取消，已在进行的请求等它结束，
+        # 随后关闭底层生成器，保证任务报告结束后不会再有新的 Emby 请求发出
+        if future is not None and not future.cancel():
+            concurrent.futures.wait([future])
+        executor.shutdown(wait=True)
+        close = getattr(batches, "close", None)
+        if close:
+            close()
+
 class UnifiedSyncHandler:
     def __init__(self, emby_url: str, emby_api_key: str, emby_user_id: Optional[str], tmdb_api_key: str):
         self.actor_db_manager = ActorDBManager()
@@ -45,19 +75,20 @@ class UnifiedSyncHandler:
 
         # ✨ 使用带有合并逻辑的 upsert_person，但关闭在线丰富功能
         with get_central_db_connection() as conn:
-            cursor = conn.cursor()
             
-            for person_batch in emby_handler.get_all_persons_from_emby(self.emby_url, self.emby_api_key, self.emby_user_id, stop_event):
+            person_batches = emby_handler.get_all_persons_from_emby(self.emby_url, self.emby_api_key, self.emby_user_id, stop_event)
+            for person_batch in _prefetch_batches(person_batches):
                 
-                for person_emby in person_batch:
-                    if stop_event and stop_event.is_set():
-                        # ... (中止逻辑不变) ...
-                        return
+                # 本循环只做内存中的字段整理，不涉及 I/O，停止信号与处理计数按批次检查/累加即可
+                if stop_event and stop_event.is_set():
+                    # ... (中止逻辑不变) ...
+                    return
+                stats["processed"] += len(person_batch)
 
-                    stats["processed"] += 1
-                    
-                    emby_pid = str(person_emby.get("Id", "")).strip()
-                    person_name = str(person_emby.get("Name", "")).strip()
+                people_for_db = []
+                for person_emby in person_batch:
+                    emby_pid = to_stripped_str(person_emby.get("Id"))
+                    person_name = to_stripped_str(person_emby.get("Name"))
 
                     # ✨ 核心优化：在源头就跳过没有名字的演员 ✨
                     if not emby_pid or not person_name:
@@ -65,44 +96,53 @@ class UnifiedSyncHandler:
                         logger.debug(f"跳过Emby演员 (ID: {emby_pid or 'N/A'})，因为其ID或名字为空。")
                         continue
                     
-                    provider_ids = person_emby.get("ProviderIds", {})
-                    provider_ids_lower = {k.lower(): v for k, v in provider_ids.items()}
-                    
-                    person_data_for_db = {
-                        "emby_id": emby_pid,
-                        "name": person_name,
-                        "tmdb_id": provider_ids_lower.get("tmdb"),
-                        "imdb_id": provider_ids_lower.get("imdb"),
-                        "douban_id": provider_ids_lower.get("douban"),
-                    }
-                    
-                    try:
-                        # ✨✨✨ 核心修改：关闭 enrich_details ✨✨✨
-                        map_id = self.actor_db_manager.upsert_person(
-                            cursor, 
-                            person_data_for_db,
-                            # 我们不需要传递 tmdb_api_key，因为 enrich_details 是 False
-                            enrich_details=False 
-                        )
-                        # upsert_person 返回-1表示传入数据无效，但我们已经在前面检查过了
+                    # 直接在一次遍历中把 ProviderIds 映射到目标字段，不再为每位演员构造小写键的中间字典
+                    person_for_db = {"emby_id": emby_pid, "name": person_name, "tmdb_id": None, "imdb_id": None, "douban_id": None}
+                    for provider, provider_id in (person_emby.get("ProviderIds") or {}).items():
+                        field = _PROVIDER_ID_FIELDS.get(provider.lower())
+                        if field:
+                            person_for_db[field] = provider_id
+                    people_for_db.append(person_for_db)
+                
+                # ✨ 整批演员在同一个事务中写入，每批只提交一次 ✨
+                try:
+                    # 演员映射可随时从 Emby 重新同步，本批次事务无需等待 WAL 刷盘
+                    with conn.cursor() as cursor:
+                        relax_commit_durability(cursor)
+                    # ✨✨✨ 核心修改：关闭 enrich_details ✨✨✨
+                    map_ids = self.actor_db_manager.upsert_person_batch(
+                        conn,
+                        people_for_db,
+                        # 我们不需要传递 tmdb_api_key，因为 enrich_details 是 False
+                        enrich_details=False 
+                    )
+                    for map_id in map_ids:
                         if map_id > 0: 
                             stats['success'] += 1
                         elif map_id == -1:
                             # 当 upsert_person 返回 -1 时，意味着发生了冲突或可预见的错误
                             # 我们将其计入 'errors' 或 'skipped' 计数器
                             stats['errors'] += 1
-                    except Exception as e_upsert:
-                        # 新的 upsert_person 内部会处理 IntegrityError，所以这里只捕获通用异常
-                        logger.error(f"同步时写入数据库失败 for EmbyPID {emby_pid}: {e_upsert}")
-                        stats['errors'] += 1
+                except Exception as e_upsert:
+                    # upsert_person 内部会处理单条记录的数据库错误，这里只捕获整批失败的异常
+                    logger.error(f"同步时批量写入数据库失败 ({len(people_for_db)} 条): {e_upsert}")
+                    stats['errors'] += len(people_for_db)
 
                 # 3. 在处理完每一批后，立刻汇报进度！
                 if update_status_callback and total_from_emby > 0:
                     progress = int((stats["processed"] / total_from_emby) * 100)
                     message = f"正在同步演员... ({stats['processed']}/{total_from_emby})"
                     update_status_callback(progress, message)
-                
-                conn.commit() # 每处理完一批就提交一次事务
+
+            # ★★★ 大批量写入后刷新统计信息，让后续按各ID列的查找继续走唯一索引 ★★★
+            if stats['success'] > 0:
+                try:
+                    with conn.cursor() as cursor:
+                        cursor.execute("ANALYZE person_identity_map")
+                    conn.commit()
+                except Exception as e_analyze:
+                    conn.rollback()
+                    logger.warning(f"同步后更新 person_identity_map 统计信息失败: {e_analyze}")
 
         # ... (最终的统计日志) ...
         logger.info("--- 同步演员映射完成 ---")
@@ -5,6 +5,7 @@ import threading
 import concurrent.futures
 import time
 import psycopg2
+from psycopg2.extras import execute_values
 import constants
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Tuple, Set, Callable
@@ -16,7 +17,7 @@ import utils
 import tmdb_handler
 from douban import DoubanApi
 from ai_translator import AITranslator
-from utils import contains_chinese
+from utils import contains_chinese, to_stripped_str
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,17 @@ logger = logging.getLogger(__name__)
 # 模块 2: 通用的业务逻辑函数 (Business Logic Helpers)
 # ======================================================================
 # --- 演员选择 ---
+# 角色名占位符（小写比较）
+_ROLE_PLACEHOLDERS = frozenset({"actor", "actress", "演员", "配音"})
+
+def _role_rank(role: str) -> int:
+    """角色名的优先级：有效中文名 3 > 有效非中文名 2 > 占位符 1 > 空 0。"""
+    if not role:
+        return 0
+    if role.lower() in _ROLE_PLACEHOLDERS:
+        return 1
+    return 3 if utils.contains_chinese(role) else 2
+
 def select_best_role(current_role: str, candidate_role: str) -> str:
     """
     根据优先级选择最佳角色名。
@@ -37,64 +49,29 @@ def select_best_role(current_role: str, candidate_role: str) -> str:
     5. 空字符串
     """
     # --- 步骤 1: 清理和规范化输入 ---
-    original_current = current_role # 保存原始值用于日志
-    original_candidate = candidate_role # 保存原始值用于日志
-    
-    current_role = str(current_role or '').strip()
-    candidate_role = str(candidate_role or '').strip()
-
-    # --- 步骤 2: 准备日志和判断标志 ---
-    logger.debug(f"  -> 备选角色名: 当前='{current_role}', 豆瓣='{candidate_role}'")
-
-    current_is_chinese = utils.contains_chinese(current_role)
-    candidate_is_chinese = utils.contains_chinese(candidate_role)
-    
-    # 定义一个更广泛的占位符列表
-    placeholders = {"actor", "actress", "演员", "配音"}
-    current_is_placeholder = current_role.lower() in placeholders
-    candidate_is_placeholder = candidate_role.lower() in placeholders
-
-    # --- 步骤 3: 应用优先级规则并记录决策 ---
-
-    # 优先级 1: 豆瓣角色是有效的中文名
-    if candidate_is_chinese and not candidate_is_placeholder:
-        logger.trace(f"  -> 决策: [优先级1] 豆瓣角色是有效中文名。选择豆瓣角色。")
-        logger.debug(f"  -> 选择: '{candidate_role}'")
-        return candidate_role
-
-    # 优先级 2: 当前角色是有效的中文名，而豆瓣角色不是。必须保留当前角色！
-    if current_is_chinese and not current_is_placeholder and not candidate_is_chinese:
-        logger.trace(f"  -> 决策: [优先级2] 当前角色是有效中文名，而豆瓣不是。保留当前角色。")
-        logger.debug(f"  -> 选择: '{current_role}'")
-        return current_role
-
-    # 优先级 3: 两者都不是有效的中文名（或都是）。选择一个非占位符的，豆瓣者优先。
-    if candidate_role and not candidate_is_placeholder:
-        logger.trace(f"  -> 决策: [优先级3] 豆瓣角色是有效的非中文名/占位符。选择豆瓣角色。")
-        logger.debug(f"  -> 选择: '{candidate_role}'")
-        return candidate_role
-    
-    if current_role and not current_is_placeholder:
-        logger.trace(f"  -> 决策: [优先级4] 当前角色是有效的非中文名/占位符，而豆瓣角色是无效的。保留当前角色。")
-        logger.debug(f"  -> 选择: '{current_role}'")
+    current_role = to_stripped_str(current_role)
+    candidate_role = to_stripped_str(candidate_role)
+
+    # 快速路径：两者都为空（最常见的情况之一），无需任何判断
+    if not current_role and not candidate_role:
+        logger.trace("  -> 决策: [优先级7] 所有输入均为空或无效。返回空字符串。")
+        return ""
+    # 快速路径：一方为空或两者相同时结果已确定，无需打分（与下方规则结果一致）
+    if not candidate_role or candidate_role == current_role:
         return current_role
-
-    # 优先级 4: 处理占位符。如果两者之一是占位符，则返回一个（豆瓣优先）。
-    if candidate_role: # 如果豆瓣有内容（此时只能是占位符）
-        logger.trace(f"  -> 决策: [优先级5] 豆瓣角色是占位符。选择豆瓣角色。")
-        logger.debug(f"  -> 选择: '{candidate_role}'")
+    if not current_role:
         return candidate_role
-        
-    if current_role: # 如果当前有内容（此时只能是占位符）
-        logger.trace(f"  -> 决策: [优先级6] 当前角色是占位符，豆瓣为空。保留当前角色。")
-        logger.debug(f"  -> 选择: '{current_role}'")
-        return current_role
 
-    # 优先级 5: 所有情况都处理完，只剩下两者都为空。
-    logger.trace(f"  -> 决策: [优先级7] 所有输入均为空或无效。返回空字符串。")
-    logger.debug(f"  -> 选择: ''")
-    return ""
+    # --- 步骤 2: 按优先级为两个角色名打分，分高者胜，平分时豆瓣优先 ---
+    # (该规则与逐条判断的优先级 1~6 完全等价，只是省去了逐个分支)
+    candidate_rank = _role_rank(candidate_role)
+    best_role = candidate_role if candidate_rank >= _role_rank(current_role) else current_role
+    logger.debug("  -> 备选角色名: 当前='%s', 豆瓣='%s' -> 选择: '%s'", current_role, candidate_role, best_role)
+    return best_role
 # --- 质量评估 ---
+# 质量评估中视为"中文占位符"的角色名
+_QUALITY_ROLE_PLACEHOLDERS = frozenset({"演员", "配音"})
+
 def evaluate_cast_processing_quality(
     final_cast: List[Dict[str, Any]], 
     original_cast_count: int, 
@@ -118,46 +95,43 @@ def evaluate_cast_processing_quality(
     total_actors = len(final_cast)
     accumulated_score = 0.0
     
-    logger.debug(f"--- 质量评估开始 ---")
-    logger.debug(f"  - 原始演员数: {original_cast_count}")
-    logger.debug(f"  - 处理后演员数: {total_actors}")
-    logger.debug(f"------------------------------------")
+    logger.debug("--- 质量评估开始 ---")
+    logger.debug("  - 原始演员数: %s", original_cast_count)
+    logger.debug("  - 处理后演员数: %s", total_actors)
+    logger.debug("------------------------------------")
 
     for i, actor_data in enumerate(final_cast):
         # 每个演员的基础分是 0.0，通过加分项累加
         score = 0.0
         
         # --- 智能获取数据 ---
-        actor_name = actor_data.get("name") or actor_data.get("Name")
-        actor_role = actor_data.get("character") or actor_data.get("Role")
+        get = actor_data.get
+        actor_name = get("name") or get("Name")
+        actor_role = get("character") or get("Role")
         
         # --- 演员名评分 (满分 5.0) ---
-        if actor_name and utils.contains_chinese(actor_name):
-            score += 5.0
-        elif actor_name:
-            score += 1.0 # 保留一个较低的基础分给英文名
+        if actor_name:
+            score += 5.0 if utils.contains_chinese(actor_name) else 1.0 # 英文名保留一个较低的基础分
 
         # --- 角色名评分 (满分 5.0) ---
-        placeholders = {"演员", "配音"}
-        is_placeholder = (str(actor_role).endswith("(配音)")) or (str(actor_role) in placeholders)
-
-        if actor_role and utils.contains_chinese(actor_role) and not is_placeholder:
-            score += 5.0 # 有意义的中文角色名
-        elif actor_role and utils.contains_chinese(actor_role) and is_placeholder:
-            score += 2.5 # 中文占位符
-        elif actor_role:
-            score += 0.5 # 英文角色名
-
-        final_actor_score = min(10.0, score)
-        accumulated_score += final_actor_score
+        if actor_role:
+            role_text = str(actor_role)
+            if utils.contains_chinese(role_text):
+                is_placeholder = role_text.endswith("(配音)") or role_text in _QUALITY_ROLE_PLACEHOLDERS
+                score += 2.5 if is_placeholder else 5.0 # 中文占位符 / 有意义的中文角色名
+            else:
+                score += 0.5 # 英文角色名
+
+        # 名字与角色各自最多 5.0 分，单项评分天然不超过 10.0，无需再做 min() 截断
+        accumulated_score += score
         
-        logger.debug(f"  [{i+1}/{total_actors}] 演员: '{actor_name}' (角色: '{actor_role}') | 单项评分: {final_actor_score:.1f}")
+        logger.debug("  [%s/%s] 演员: '%s' (角色: '%s') | 单项评分: %.1f", i + 1, total_actors, actor_name, actor_role, score)
 
     avg_score = accumulated_score / total_actors if total_actors > 0 else 0.0
     
     # --- ✨✨✨ 核心修改：条件化的数量惩罚逻辑 ✨✨✨ ---
-    logger.debug(f"------------------------------------")
-    logger.debug(f"  - 基础平均分 (惩罚前): {avg_score:.2f}")
+    logger.debug("------------------------------------")
+    logger.debug("  - 基础平均分 (惩罚前): %.2f", avg_score)
 
     if is_animation:
         logger.debug("  - 惩罚: 检测到为动画片或纪录片，跳过所有数量相关的惩罚。")
@@ -178,7 +152,7 @@ def evaluate_cast_processing_quality(
             logger.warning(f"  - 惩罚: 数量从{original_cast_count}大幅减少到{total_actors}，乘以惩罚因子 {penalty_factor:.2f}")
             avg_score *= penalty_factor
         else:
-            logger.debug(f"  - 惩罚: 数量正常，不进行惩罚。")
+            logger.debug("  - 惩罚: 数量正常，不进行惩罚。")
     
     final_score_rounded = round(avg_score, 1)
     logger.info(f" --- 最终评分: {final_score_rounded:.1f} ---")
@@ -207,11 +181,11 @@ def translate_actor_field(text: Optional[str], db_manager: ActorDBManager, db_cu
             return cached_translation
         # 情况 B: 缓存中明确记录了这是一个失败的翻译
         else:
-            logger.debug(f"数据库翻译缓存命中 (失败记录) for '{text_stripped}'，不再尝试在线翻译。")
+            logger.debug("数据库翻译缓存命中 (失败记录) for '%s'，不再尝试在线翻译。", text_stripped)
             return text # 直接返回原文，避免重复请求
 
     # 4. 如果缓存中完全没有记录，才进行在线翻译
-    logger.debug(f"'{text_stripped}' 在翻译缓存中未找到，将进行在线翻译...")
+    logger.debug("'%s' 在翻译缓存中未找到，将进行在线翻译...", text_stripped)
     final_translation = None
     final_engine = "unknown"
 
@@ -221,7 +195,7 @@ def translate_actor_field(text: Optional[str], db_manager: ActorDBManager, db_cu
     # 步骤 1: 如果AI翻译启用，优先尝试AI
     if ai_translator and ai_enabled:
         ai_translation_attempted = True
-        logger.debug(f"AI翻译已启用，优先尝试使用 '{ai_translator.provider}' 进行翻译...")
+        logger.debug("AI翻译已启用，优先尝试使用 '%s' 进行翻译...", ai_translator.provider)
         try:
             # ai_translator.translate 应该在失败时返回 None 或抛出异常
             ai_result = ai_translator.translate(text_stripped)
@@ -282,39 +256,40 @@ def format_douban_cast(douban_api_actors_raw: List[Dict[str, Any]]) -> List[Dict
     """格式化豆瓣原始演员数据并进行初步去重。"""
     formatted_candidates = []
     seen_douban_ids = set()
-    seen_name_sigs = set()
     seen_names = set()
     for item in douban_api_actors_raw:
-        name_zh = str(item.get("name", "")).strip()
-        if not name_zh: 
-            continue
-            
-        douban_id = str(item.get("id", "")).strip() or None
-
+        get = item.get
+        name_zh = to_stripped_str(get("name"))
         # 【★★★ 核心修复：严格的去重逻辑 ★★★】
-        # 1. 如果有豆瓣ID，且ID已存在，则跳过。
-        if douban_id and douban_id in seen_douban_ids:
+        # 名字为空或已存在的直接跳过，无需再解析豆瓣ID
+        if not name_zh or name_zh in seen_names:
             continue
-        
-        # 2. 如果名字已存在，则跳过。
-        if name_zh in seen_names:
-            continue
-
-        # 如果能走到这里，说明是唯一的演员，记录下来
+            
+        douban_id = to_stripped_str(get("id")) or None
+        # 如果有豆瓣ID，且ID已存在，则跳过。
         if douban_id:
+            if douban_id in seen_douban_ids:
+                continue
             seen_douban_ids.add(douban_id)
+
+        # 如果能走到这里，说明是唯一的演员，记录下来
         seen_names.add(name_zh)
         
         formatted_candidates.append({
             "Name": name_zh,
-            "OriginalName": str(item.get("original_name", "")).strip(),
-            "Role": str(item.get("character", "")).strip(),
+            "OriginalName": to_stripped_str(get("original_name")),
+            "Role": to_stripped_str(get("character")),
             "DoubanCelebrityId": douban_id,
             "ProviderIds": {"Douban": douban_id} if douban_id else {},
         })
         
     return formatted_candidates
 # ✨✨✨格式化演员表✨✨✨
+# 通用角色名：不加前缀，手动模式下排到末尾
+_GENERIC_ROLES = frozenset({"演员", "配音"})
+# 中文角色名需去除的半角/全角空格，str.translate 一次扫描删除
+_ROLE_SPACE_TABLE = str.maketrans("", "", " 　")
+
 def format_and_complete_cast_list(
     cast_list: List[Dict[str, Any]], 
     is_animation: bool, 
@@ -328,43 +303,36 @@ def format_and_complete_cast_list(
     """
     processed_cast = []
     add_role_prefix = config.get(constants.CONFIG_OPTION_ACTOR_ROLE_ADD_PREFIX, False)
-    generic_roles = {"演员", "配音"}
+    # 与动画/真人相关的前缀和默认角色名在整个列表中都一样，循环外计算一次
+    role_prefix = "配 " if is_animation else "饰 "
+    default_role = "配音" if is_animation else "演员"
 
-    logger.debug(f"  -> 格式化演员列表，调用模式: '{mode}' (前缀开关: {'开' if add_role_prefix else '关'})")
+    logger.debug("  -> 格式化演员列表，调用模式: '%s' (前缀开关: %s)", mode, '开' if add_role_prefix else '关')
 
     # --- 阶段1: 统一的角色名格式化 (所有模式通用) ---
-    for idx, actor in enumerate(cast_list):
+    for actor in cast_list:
         new_actor = actor.copy()
         
         # (角色名处理逻辑保持不变)
         character_name = new_actor.get("character")
         final_role = character_name.strip() if character_name else ""
-        if utils.contains_chinese(final_role):
-            final_role = final_role.replace(" ", "").replace("　", "")
-        if add_role_prefix:
-            if final_role and final_role not in generic_roles:
-                prefix = "配 " if is_animation else "饰 "
-                final_role = f"{prefix}{final_role}"
-            elif not final_role:
-                final_role = "配音" if is_animation else "演员"
-        else:
-            if not final_role:
-                final_role = "配音" if is_animation else "演员"
+        # 中文角色名去掉半角/全角空格；多数角色名不含空格，先做廉价的包含判断
+        if (" " in final_role or "　" in final_role) and utils.contains_chinese(final_role):
+            final_role = final_role.translate(_ROLE_SPACE_TABLE)
+        if not final_role:
+            final_role = default_role
+        elif add_role_prefix and final_role not in _GENERIC_ROLES:
+            final_role = f"{role_prefix}{final_role}"
         new_actor["character"] = final_role
         
-        # 为 'manual' 模式记录原始顺序
-        new_actor['original_index'] = idx
-        
         processed_cast.append(new_actor)
 
     # --- 阶段2: 根据模式执行不同的排序策略 ---
     if mode == 'manual':
         # 【手动模式】：以用户自定义顺序为基础，并增强（通用角色后置）
         logger.debug("  -> 应用 'manual' 排序策略：保留用户自定义顺序，并将通用角色后置。")
-        processed_cast.sort(key=lambda actor: (
-            1 if actor.get("character") in generic_roles else 0,  # 1. 通用角色排在后面
-            actor.get("original_index")                          # 2. 在此基础上，保持原始手动顺序
-        ))
+        # list.sort 是稳定排序：只按"是否通用角色"排序，同组内自然保持原始手动顺序
+        processed_cast.sort(key=lambda actor: actor["character"] in _GENERIC_ROLES)
     else: # mode == 'auto' 或其他任何默认情况
         # 【自动模式】：严格按照TMDb原始的 'order' 字段排序
         logger.debug("  -> 应用 'auto' 排序策略：严格按原始TMDb 'order' 字段排序。")
@@ -373,11 +341,15 @@ def format_and_complete_cast_list(
     # --- 阶段3: 最终重置 order 索引 (所有模式通用) ---
     for new_idx, actor in enumerate(processed_cast):
         actor["order"] = new_idx
-        if 'original_index' in actor:
-            del actor['original_index'] # 清理临时key
             
     return processed_cast
 # --- 用于获取单个演员的TMDb详情 ---
+# 演员数据补充任务实际使用的 TMDb 人物字段
+_TMDB_ACTOR_DETAIL_FIELDS = (
+    "external_ids", "english_name_from_translations", "original_name",
+    "profile_path", "gender", "adult", "popularity",
+)
+
 def fetch_tmdb_details_for_actor(actor_info: Dict, tmdb_api_key: str) -> Optional[Dict]:
     """一个独立的、可在线程中运行的函数，用于获取单个演员的TMDb详情。"""
     tmdb_id = actor_info.get("tmdb_person_id")
@@ -390,8 +362,12 @@ def fetch_tmdb_details_for_actor(actor_info: Dict, tmdb_api_key: str) -> Optiona
             append_to_response="external_ids,translations"
         )
         if details:
-            # 成功获取，返回详情
-            return {"tmdb_id": tmdb_id, "status": "found", "details": details}
+            # 成功获取，只返回调用方用到的字段；translations 含各语言的完整简介，
+            # 在此处丢弃，避免整批 (200 个) 演员的大段 JSON 同时驻留内存。
+            # 注意这只节省内存、不节省流量：english_name_from_translations 依赖 translations，
+            # 而 TMDb 的 person 接口不支持按字段裁剪响应，请求本身无法再缩小。
+            slim_details = {key: details.get(key) for key in _TMDB_ACTOR_DETAIL_FIELDS if key in details}
+            return {"tmdb_id": tmdb_id, "status": "found", "details": slim_details}
         else:
             # API调用成功但返回空，也标记为未找到
             return {"tmdb_id": tmdb_id, "status": "not_found"}
@@ -441,133 +417,171 @@ def enrich_all_actor_aliases_task(
             cursor = conn.cursor()
             
             # ★★★ 核心修复 1/5：使用 PostgreSQL 的日期计算语法 ★★★
-            sql_find_tmdb_needy = f"""
-                SELECT p.* FROM person_identity_map p
+            # 只取后续真正用到的列；用服务端游标分批读取，内存中只保留当前批次
+            sql_needy_conditions = f"""
+                FROM person_identity_map p
                 LEFT JOIN actor_metadata m ON p.tmdb_person_id = m.tmdb_id
                 WHERE p.tmdb_person_id IS NOT NULL AND (p.imdb_id IS NULL OR m.tmdb_id IS NULL OR m.profile_path IS NULL OR m.gender IS NULL OR m.original_name IS NULL)
                 AND (m.last_updated_at IS NULL OR m.last_updated_at < NOW() - INTERVAL '{SYNC_INTERVAL_DAYS} days')
-                ORDER BY m.last_updated_at ASC
             """
+            sql_find_tmdb_needy = f"SELECT p.map_id, p.tmdb_person_id {sql_needy_conditions} ORDER BY m.last_updated_at ASC"
+            # 计数与下面 WITH HOLD 游标的物化都在这一个事务内完成，大连接/排序在内存中进行
+            db_handler.raise_sort_memory(cursor)
             # ★★★ 核心修复 2/5：psycopg2 不支持链式调用 .fetchall() ★★★
-            cursor.execute(sql_find_tmdb_needy)
-            actors_for_tmdb = cursor.fetchall()
+            cursor.execute(f"SELECT COUNT(*) AS total {sql_needy_conditions}")
+            total_tmdb = cursor.fetchone()['total']
             
-            if actors_for_tmdb:
-                total_tmdb = len(actors_for_tmdb)
+            if total_tmdb:
                 logger.info(f"  -> 找到 {total_tmdb} 位演员需要从 TMDb 补充元数据。")
                 
                 CHUNK_SIZE = 200
                 MAX_TMDB_WORKERS = 5
 
-                for i in range(0, total_tmdb, CHUNK_SIZE):
-                    if (stop_event and stop_event.is_set()) or (time.time() >= end_time):
-                        logger.info("达到运行时长或收到停止信号，在 TMDb 下批次开始前结束。")
-                        break
-
-                    progress = 5 + int((i / total_tmdb) * 65)
-                    chunk_num = i//CHUNK_SIZE + 1
-                    total_chunks = (total_tmdb + CHUNK_SIZE - 1) // CHUNK_SIZE
-                    if update_status_callback:
-                        update_status_callback(progress, f"阶段1/2 (TMDb): 处理批次 {chunk_num}/{total_chunks}")
-
-                    chunk = actors_for_tmdb[i:i + CHUNK_SIZE]
-                    logger.info(f"  -> 开始处理 TMDb 第 {chunk_num} 批次，共 {len(chunk)} 个演员 ---")
-
-                    imdb_updates_to_commit = []
-                    metadata_to_commit = []
-                    invalid_tmdb_ids = []
+                # WITH HOLD：批次之间的 conn.commit()/rollback() 不会关闭游标。
+                # 声明后立即提交一次，让游标脱离当前事务，之后某批次回滚也不会影响它。
+                with conn.cursor(name="tmdb_needy_actors", withhold=True) as needy_cursor:
+                    needy_cursor.execute(sql_find_tmdb_needy)
+                    conn.commit()
+                    for i in range(0, total_tmdb, CHUNK_SIZE):
+                        if (stop_event and stop_event.is_set()) or (time.time() >= end_time):
+                            logger.info("达到运行时长或收到停止信号，在 TMDb 下批次开始前结束。")
+                            break
+
+                        progress = 5 + int((i / total_tmdb) * 65)
+                        chunk_num = i//CHUNK_SIZE + 1
+                        total_chunks = (total_tmdb + CHUNK_SIZE - 1) // CHUNK_SIZE
+                        if update_status_callback:
+                            update_status_callback(progress, f"阶段1/2 (TMDb): 处理批次 {chunk_num}/{total_chunks}")
+
+                        chunk = needy_cursor.fetchmany(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        # FETCH 会隐式开启一个事务；在发起 TMDb 网络请求前立即结束它，
+                        # 避免连接在整批请求期间处于 "idle in transaction" 状态并持有快照。
+                        conn.commit()
+                        logger.info(f"  -> 开始处理 TMDb 第 {chunk_num} 批次，共 {len(chunk)} 个演员 ---")
+
+                        imdb_updates_to_commit = []
+                        metadata_to_commit = []
+                        invalid_tmdb_ids = []
                     
-                    tmdb_success_count, imdb_found_count, metadata_added_count, not_found_count = 0, 0, 0, 0
+                        tmdb_success_count, imdb_found_count, metadata_added_count, not_found_count = 0, 0, 0, 0
 
-                    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_TMDB_WORKERS) as executor:
-                        future_to_actor = {executor.submit(fetch_tmdb_details_for_actor, dict(actor), tmdb_api_key): actor for actor in chunk}
+                        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_TMDB_WORKERS) as executor:
+                            future_to_actor = {executor.submit(fetch_tmdb_details_for_actor, dict(actor), tmdb_api_key): actor for actor in chunk}
                         
-                        for future in concurrent.futures.as_completed(future_to_actor):
-                            if stop_event and stop_event.is_set():
-                                for f in future_to_actor: f.cancel()
-                                raise InterruptedError("任务在TMDb处理批次中被中止")
-
-                            result = future.result()
-                            if not result: continue
-
-                            status = result.get("status")
-                            tmdb_id = result.get("tmdb_id")
-                            details = result.get("details", {})
-
-                            if status == "found" and details:
-                                tmdb_success_count += 1
-                                imdb_id = details.get("external_ids", {}).get("imdb_id")
-                                if imdb_id:
-                                    imdb_found_count += 1
-                                    imdb_updates_to_commit.append((imdb_id, tmdb_id))
+                            for future in concurrent.futures.as_completed(future_to_actor):
+                                if stop_event and stop_event.is_set():
+                                    for f in future_to_actor: f.cancel()
+                                    raise InterruptedError("任务在TMDb处理批次中被中止")
+
+                                result = future.result()
+                                if not result: continue
+
+                                status = result.get("status")
+                                tmdb_id = result.get("tmdb_id")
+                                details = result.get("details", {})
+
+                                if status == "found" and details:
+                                    tmdb_success_count += 1
+                                    imdb_id = details.get("external_ids", {}).get("imdb_id")
+                                    if imdb_id:
+                                        imdb_found_count += 1
+                                        imdb_updates_to_commit.append((imdb_id, tmdb_id))
                                 
-                                best_original_name = None
-                                if details.get("english_name_from_translations"):
-                                    best_original_name = details.get("english_name_from_translations")
-                                elif details.get("original_name") and not contains_chinese(details.get("original_name")):
-                                    best_original_name = details.get("original_name")
+                                    best_original_name = None
+                                    if details.get("english_name_from_translations"):
+                                        best_original_name = details.get("english_name_from_translations")
+                                    elif details.get("original_name") and not contains_chinese(details.get("original_name")):
+                                        best_original_name = details.get("original_name")
                                 
-                                metadata_entry = {
-                                    "tmdb_id": tmdb_id,
-                                    "profile_path": details.get("profile_path"),
-                                    "gender": details.get("gender"),
-                                    "adult": details.get("adult", False),
-                                    "popularity": details.get("popularity"),
-                                    "original_name": best_original_name
-                                }
-                                metadata_to_commit.append(metadata_entry)
-                                metadata_added_count += 1
+                                    metadata_entry = {
+                                        "tmdb_id": tmdb_id,
+                                        "profile_path": details.get("profile_path"),
+                                        "gender": details.get("gender"),
+                                        "adult": details.get("adult", False),
+                                        "popularity": details.get("popularity"),
+                                        "original_name": best_original_name
+                                    }
+                                    metadata_to_commit.append(metadata_entry)
+                                    metadata_added_count += 1
                             
-                            elif status == "not_found":
-                                not_found_count += 1
-                                invalid_tmdb_ids.append(tmdb_id)
-
-                    logger.info(
-                        f"  -> 批次处理完成。摘要: "
-                        f"成功获取({tmdb_success_count}), 新增IMDb({imdb_found_count}), "
-                        f"新增元数据({metadata_added_count}), 未找到({not_found_count})."
-                    )
+                                elif status == "not_found":
+                                    not_found_count += 1
+                                    invalid_tmdb_ids.append(tmdb_id)
+
+                        logger.info(
+                            f"  -> 批次处理完成。摘要: "
+                            f"成功获取({tmdb_success_count}), 新增IMDb({imdb_found_count}), "
+                            f"新增元数据({metadata_added_count}), 未找到({not_found_count})."
+                        )
                     
-                    if imdb_updates_to_commit or metadata_to_commit or invalid_tmdb_ids:
-                        try:
-                            logger.info(f"  -> 批次完成，准备写入数据库...")
-
-                            if metadata_to_commit:
-                                # ★★★ 核心修复 3/5：使用 ON CONFLICT 语法替代 INSERT OR REPLACE ★★★
-                                cols = metadata_to_commit[0].keys()
-                                cols_str = ", ".join(cols)
-                                placeholders_str = ", ".join([f"%({k})s" for k in cols])
-                                update_cols = [f"{col} = EXCLUDED.{col}" for col in cols if col != 'tmdb_id']
-                                update_str = ", ".join(update_cols)
+                        if imdb_updates_to_commit or metadata_to_commit or invalid_tmdb_ids:
+                            try:
+                                logger.info(f"  -> 批次完成，准备写入数据库...")
+                                # 写入的都是可由本任务重新补充的数据，本事务无需等待 WAL 刷盘
+                                db_handler.relax_commit_durability(cursor)
+
+                                if metadata_to_commit:
+                                    # ★★★ 核心修复 3/5：使用 ON CONFLICT 语法替代 INSERT OR REPLACE ★★★
+                                    cols = metadata_to_commit[0].keys()
+                                    cols_str = ", ".join(cols)
+                                    placeholders_str = ", ".join([f"%({k})s" for k in cols])
+                                    update_cols = [f"{col} = EXCLUDED.{col}" for col in cols if col != 'tmdb_id']
+                                    update_str = ", ".join(update_cols)
                                 
-                                sql_upsert_metadata = f"""
-                                    INSERT INTO actor_metadata ({cols_str}, last_updated_at)
-                                    VALUES ({placeholders_str}, NOW())
-                                    ON CONFLICT (tmdb_id) DO UPDATE SET {update_str}, last_updated_at = NOW()
-                                """
-                                cursor.executemany(sql_upsert_metadata, metadata_to_commit)
-                                logger.trace(f"成功批量写入 {len(metadata_to_commit)} 条演员元数据。")
-
-                            for imdb_id, tmdb_id in imdb_updates_to_commit:
-                                try:
-                                    cursor.execute("UPDATE person_identity_map SET imdb_id = %s WHERE tmdb_person_id = %s", (imdb_id, tmdb_id))
-                                except psycopg2.IntegrityError as ie:
-                                    # ★★★ 核心修复 4/5：使用 PostgreSQL 的错误信息判断冲突 ★★★
-                                    if "violates unique constraint" in str(ie):
-                                        logger.warning(f"  -> 检测到 IMDb ID '{imdb_id}' (来自TMDb: {tmdb_id}) 冲突。将执行合并逻辑。")
-                                        # ... (合并逻辑保持不变)
-                                    else:
-                                        raise ie
-
-                            if invalid_tmdb_ids:
-                                cursor.executemany("UPDATE person_identity_map SET tmdb_person_id = NULL WHERE tmdb_person_id = %s", [(tid,) for tid in invalid_tmdb_ids])
-
-                            conn.commit()
-                            logger.info("✅ 数据库更改已成功提交。")
-
-                        except Exception as db_e:
-                            logger.error(f"数据库操作失败: {db_e}", exc_info=True)
-                            conn.rollback()
+                                    sql_upsert_metadata = f"""
+                                        INSERT INTO actor_metadata ({cols_str}, last_updated_at)
+                                        VALUES ({placeholders_str}, NOW())
+                                        ON CONFLICT (tmdb_id) DO UPDATE SET {update_str}, last_updated_at = NOW()
+                                    """
+                                    cursor.executemany(sql_upsert_metadata, metadata_to_commit)
+                                    logger.trace(f"成功批量写入 {len(metadata_to_commit)} 条演员元数据。")
+
+                                if imdb_updates_to_commit:
+                                    # 同一批次里多个 TMDb ID 解析出同一个 IMDb ID 时只保留第一个，避免语句内部自相冲突
+                                    unique_updates, seen_imdb_ids = [], set()
+                                    for imdb_id, tmdb_id in imdb_updates_to_commit:
+                                        if imdb_id not in seen_imdb_ids:
+                                            seen_imdb_ids.add(imdb_id)
+                                            unique_updates.append((imdb_id, tmdb_id))
+
+                                    # 一条 UPDATE ... FROM (VALUES ...) 写回整批 IMDb ID；
+                                    # 已被其他演员占用的 IMDb ID 由 NOT EXISTS 预先排除，不会触发唯一约束错误而中断事务。
+                                    sql_update_imdb = """
+                                        UPDATE person_identity_map p SET imdb_id = v.imdb_id
+                                        FROM (VALUES %s) AS v(imdb_id, tmdb_person_id)
+                                        WHERE p.tmdb_person_id = v.tmdb_person_id
+                                          AND NOT EXISTS (
+                                              SELECT 1 FROM person_identity_map o
+                                              WHERE o.imdb_id = v.imdb_id AND o.map_id <> p.map_id
+                                          )
+                                        RETURNING p.tmdb_person_id
+                                    """
+                                    updated_rows = execute_values(
+                                        cursor, sql_update_imdb, unique_updates,
+                                        template="(%s, %s::integer)", fetch=True
+                                    )
+                                    updated_tmdb_ids = {row['tmdb_person_id'] for row in updated_rows}
+                                    for imdb_id, tmdb_id in unique_updates:
+                                        if int(tmdb_id) not in updated_tmdb_ids:
+                                            logger.warning(f"  -> 检测到 IMDb ID '{imdb_id}' (来自TMDb: {tmdb_id}) 冲突，跳过更新。")
+
+                                if invalid_tmdb_ids:
+                                    # ★★★ 单条 ANY 语句一次清理整批失效的 TMDb ID，代替逐行 UPDATE ★★★
+                                    cursor.execute(
+                                        "UPDATE person_identity_map SET tmdb_person_id = NULL WHERE tmdb_person_id = ANY(%s)",
+                                        ([int(tid) for tid in invalid_tmdb_ids],)
+                                    )
+
+                                conn.commit()
+                                # 上面的批量 UPDATE 绕过了 upsert_person，需让演员查找缓存失效
+                                ActorDBManager.clear_person_cache()
+                                logger.info("✅ 数据库更改已成功提交。")
+
+                            except Exception as db_e:
+                                logger.error(f"数据库操作失败: {db_e}", exc_info=True)
+                                conn.rollback()
             else:
                 logger.info("  -> 没有需要从 TMDb 补充或清理的演员。")
 
@@ -577,6 +591,7 @@ def enrich_all_actor_aliases_task(
             douban_api = DoubanApi()
             logger.info("  -> 阶段二：从 豆瓣 补充 IMDb ID ---")
             cursor = conn.cursor()
+            db_handler.relax_commit_durability(cursor)
             # ★★★ 核心修复 1/5 (再次应用)：使用 PostgreSQL 的日期计算语法 ★★★
             sql_find_douban_needy = f"""
                 SELECT * FROM person_identity_map 
@@ -593,6 +608,9 @@ def enrich_all_actor_aliases_task(
                 logger.info(f"  -> 找到 {total_douban} 位演员需要从豆瓣补充 IMDb ID。")
                 
                 processed_count = 0
+                # 已访问过豆瓣的 map_id 先缓存起来，每次提交前用一条语句统一刷新 last_synced_at
+                pending_sync_ids = []
+                sql_update_sync = "UPDATE person_identity_map SET last_synced_at = NOW() WHERE map_id = ANY(%s)"
                 for i, actor in enumerate(actors_for_douban):
                     if (stop_event and stop_event.is_set()) or (time.time() >= end_time): break
                     
@@ -606,8 +624,7 @@ def enrich_all_actor_aliases_task(
                         update_status_callback(progress, f"阶段2/2 (豆瓣): {i+1}/{total_douban} - {actor_primary_name}")
                     
                     try:
-                        sql_update_sync = "UPDATE person_identity_map SET last_synced_at = NOW() WHERE map_id = %s"
-                        cursor.execute(sql_update_sync, (actor_map_id,))
+                        pending_sync_ids.append(actor_map_id)
 
                         details = douban_api.celebrity_details(actor_douban_id)
                         
@@ -622,10 +639,14 @@ def enrich_all_actor_aliases_task(
                                 logger.info(f"  ({i+1}/{total_douban}) 为演员 '{actor_primary_name}' (Douban: {actor_douban_id}) 找到 IMDb ID: {new_imdb_id}")
                                 
                                 try:
+                                    # 保存点：唯一约束冲突只回滚这一条更新，不会让整个事务进入中止状态
+                                    cursor.execute("SAVEPOINT douban_imdb_update")
                                     sql_update_imdb = "UPDATE person_identity_map SET imdb_id = %s WHERE map_id = %s"
                                     cursor.execute(sql_update_imdb, (new_imdb_id, actor_map_id))
+                                    cursor.execute("RELEASE SAVEPOINT douban_imdb_update")
                                 
                                 except psycopg2.IntegrityError as ie:
+                                    cursor.execute("ROLLBACK TO SAVEPOINT douban_imdb_update")
                                     # ★★★ 核心修复 4/5 (再次应用)：使用 PostgreSQL 的错误信息判断冲突 ★★★
                                     if "violates unique constraint" in str(ie):
                                         logger.warning(f"  -> 检测到 IMDb ID '{new_imdb_id}' 冲突。将尝试合并记录。")
@@ -648,12 +669,20 @@ def enrich_all_actor_aliases_task(
 
                         if (i + 1) % 50 == 0:
                             logger.info(f"  -> 已处理50条，提交数据库事务...")
+                            cursor.execute(sql_update_sync, (pending_sync_ids,))
+                            pending_sync_ids = []
                             conn.commit()
+                            db_handler.relax_commit_durability(cursor)
+                            ActorDBManager.clear_person_cache()
 
                     except Exception as e:
                         logger.error(f"处理演员 '{actor_primary_name}' (Douban: {actor_douban_id}) 时发生错误: {e}")
                 
+                if pending_sync_ids:
+                    cursor.execute(sql_update_sync, (pending_sync_ids,))
                 conn.commit()
+                # 本阶段的 IMDb 补写与豆瓣记录合并/删除都绕过了 upsert_person
+                ActorDBManager.clear_person_cache()
                 logger.info(f"豆瓣信息补充完成，本轮共处理 {processed_count} 个。")
             else:
                 logger.info("  -> 没有需要从豆瓣补充 IMDb ID 的演员。")
@@ -670,4 +699,5 @@ def enrich_all_actor_aliases_task(
         # ★★★ 核心修复 5/5：移除 .in_transaction 检查 ★★★
         if conn: conn.rollback()
     finally:
+        db_handler.close_thread_connection()
         logger.trace("--- “演员数据补充”计划任务已退出 ---")
\ No newline at end of file
@@ -4,6 +4,8 @@ import os
 import re
 import json
 import concurrent.futures
+import functools
+import heapq
 from typing import Dict, List, Optional, Any, Tuple
 import shutil
 import threading
@@ -21,7 +23,7 @@ import constants
 import logging
 import actor_utils
 from cachetools import TTLCache
-from db_handler import ActorDBManager
+from db_handler import ActorDBManager, PERSON_MAP_COLUMNS
 from db_handler import get_db_connection as get_central_db_connection
 from ai_translator import AITranslator
 from utils import LogDBManager, get_override_path_for_item, translate_country_list
@@ -39,6 +41,14 @@ except ImportError:
         def get_acting(self, *args, **kwargs): return {}
         def close(self): pass
 
+# 按动画片处理（角色名用“配”前缀、跳过演员数量惩罚）的类型
+_ANIMATION_LIKE_GENRES = frozenset({"Animation", "动画", "Documentary", "纪录"})
+
+def _cast_order_key(actor: Dict[str, Any]) -> int:
+    """截断演员表时的排序键：缺失或为负的 order 排到最后。"""
+    order = actor.get('order')
+    return order if order is not None and order >= 0 else 999
+
 def _read_local_json(file_path: str) -> Optional[Dict[str, Any]]:
     if not os.path.exists(file_path):
         logger.warning(f"本地元数据文件不存在: {file_path}")
@@ -203,9 +213,12 @@ class MediaProcessor:
         self.tmdb_api_key = self.config.get("tmdb_api_key", "")
         self.local_data_path = self.config.get("local_data_path", "").strip()
         self.auto_lock_cast_enabled = self.config.get(constants.CONFIG_OPTION_AUTO_LOCK_CAST, True)
+        # 逐项处理时反复使用的数值配置，在初始化时解析一次 (配置变更时处理器会被重新创建)
+        self.delay_between_items = float(self.config.get("delay_between_items_sec", 0.5))
+        self.min_score_for_review = float(self.config.get("min_score_for_review", constants.DEFAULT_MIN_SCORE_FOR_REVIEW))
         
         self.ai_enabled = self.config.get("ai_translation_enabled", False)
-        self.ai_translator = AITranslator(self.config) if self.ai_enabled else None
+        # ai_translator 为延迟初始化属性，首次真正需要翻译时才创建客户端
         
         self._stop_event = threading.Event()
         self.processed_items_cache = self._load_processed_log_from_db()
@@ -260,7 +273,7 @@ class MediaProcessor:
                 person_ids = list(original_actor_map.keys())
                 
                 if person_ids:
-                    query = "SELECT * FROM person_identity_map WHERE emby_person_id = ANY(%s)"
+                    query = f"SELECT {PERSON_MAP_COLUMNS} FROM person_identity_map WHERE emby_person_id = ANY(%s)"
                     cursor.execute(query, (person_ids,))
                     db_results = cursor.fetchall()
 
@@ -292,43 +305,44 @@ class MediaProcessor:
         if ids_to_fetch_from_api:
             logger.trace(f"  -> 开始为 {len(ids_to_fetch_from_api)} 位新演员从Emby获取信息并【实时反哺】...")
             
-            with get_central_db_connection() as conn_upsert:
-                cursor_upsert = conn_upsert.cursor()
+            def _fetch_person_details(actor_id: str) -> Optional[Dict[str, Any]]:
+                return emby_handler.get_emby_item_details(
+                    item_id=actor_id,
+                    emby_server_url=self.emby_url,
+                    emby_api_key=self.emby_api_key,
+                    user_id=self.emby_user_id,
+                    fields="ProviderIds,Name"
+                )
+
+            # 网络请求并发执行，数据库写入仍在下方单线程中统一批量完成
+            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+                fetched_details = list(executor.map(_fetch_person_details, ids_to_fetch_from_api))
 
-                for i, actor_id in enumerate(ids_to_fetch_from_api):
+            people_for_db = []
+            for actor_id, full_detail in zip(ids_to_fetch_from_api, fetched_details):
+                if full_detail and full_detail.get("ProviderIds"):
+                    enriched_actor = original_actor_map[actor_id].copy()
+                    enriched_actor["ProviderIds"] = full_detail["ProviderIds"]
+                    enriched_actors_map[actor_id] = enriched_actor
                     
-                    full_detail = emby_handler.get_emby_item_details(
-                        item_id=actor_id,
-                        emby_server_url=self.emby_url,
-                        emby_api_key=self.emby_api_key,
-                        user_id=self.emby_user_id,
-                        fields="ProviderIds,Name"
-                    )
+                    provider_ids = full_detail["ProviderIds"]
+                    
+                    person_data_for_db = {
+                        "emby_id": actor_id,                      
+                        "name": full_detail.get("Name"),          
+                        "tmdb_id": provider_ids.get("Tmdb"),      
+                        "imdb_id": provider_ids.get("Imdb")       
+                    }
+                    
+                    people_for_db.append(person_data_for_db)
+                    logger.trace(f"    -> [实时反哺] 已收集演员 '{full_detail.get('Name')}' (ID: {actor_id}) 的新映射关系，稍后统一写入数据库。")
+                else:
+                    logger.warning(f"    未能从 API 获取到演员 ID {actor_id} 的 ProviderIds。")
 
-                    if full_detail and full_detail.get("ProviderIds"):
-                        enriched_actor = original_actor_map[actor_id].copy()
-                        enriched_actor["ProviderIds"] = full_detail["ProviderIds"]
-                        enriched_actors_map[actor_id] = enriched_actor
-                        
-                        provider_ids = full_detail["ProviderIds"]
-                        
-                        person_data_for_db = {
-                            "emby_id": actor_id,                      
-                            "name": full_detail.get("Name"),          
-                            "tmdb_id": provider_ids.get("Tmdb"),      
-                            "imdb_id": provider_ids.get("Imdb")       
-                        }
-                        
-                        self.actor_db_manager.upsert_person(
-                            cursor=cursor_upsert,
-                            person_data=person_data_for_db
-                        )
-                        
-                        logger.trace(f"    -> [实时反哺] 已将演员 '{full_detail.get('Name')}' (ID: {actor_id}) 的新映射关系存入数据库。")
-                    else:
-                        logger.warning(f"    未能从 API 获取到演员 ID {actor_id} 的 ProviderIds。")
-                
-                conn_upsert.commit()
+            # 整个演员表的新映射关系在同一个事务中写入，只提交一次
+            if people_for_db:
+                with get_central_db_connection() as conn_upsert:
+                    self.actor_db_manager.upsert_person_batch(conn_upsert, people_for_db)
         else:
             logger.info("  -> (API查询) 跳过：所有演员均在本地数据库中找到。")
 
@@ -369,6 +383,21 @@ class MediaProcessor:
         """返回内部的停止事件对象，以便传递给其他函数。"""
         return self._stop_event
 
+    @functools.cached_property
+    def ai_translator(self) -> Optional[AITranslator]:
+        """
+        首次访问时才创建 AI 翻译器，演员均已是中文名时可完全省去 SDK 客户端的初始化。
+        初始化失败会关闭本实例的 AI 翻译并缓存 None，避免每次访问都重试。
+        """
+        if not self.ai_enabled:
+            return None
+        try:
+            return AITranslator(self.config)
+        except Exception as e:
+            logger.error(f"AI 翻译器初始化失败，本次运行将禁用 AI 翻译: {e}")
+            self.ai_enabled = False
+            return None
+
     def is_stop_requested(self) -> bool:
         return self._stop_event.is_set()
 
@@ -377,16 +406,15 @@ class MediaProcessor:
         try:
             # 1. ★★★ 使用 with 语句和中央函数 ★★★
             with get_central_db_connection() as conn:
-                cursor = conn.cursor()
-                
-                # 2. 执行查询
-                cursor.execute("SELECT item_id, item_name FROM processed_log")
-                rows = cursor.fetchall()
-                
-                # 3. 处理结果
-                for row in rows:
-                    if row['item_id'] and row['item_name']:
-                        log_dict[row['item_id']] = row['item_name']
+                # 2. 执行查询：过滤条件下推到 SQL，并使用普通元组游标，
+                #    省去为上万行逐行构建 RealDict 对象的开销
+                with conn.cursor(cursor_factory=psycopg2.extensions.cursor) as cursor:
+                    cursor.execute(
+                        "SELECT item_id, item_name FROM processed_log "
+                        "WHERE item_id <> '' AND item_name <> ''"
+                    )
+                    # 3. 处理结果：(item_id, item_name) 元组直接构建字典
+                    log_dict = dict(cursor)
             
             # 4. with 语句会自动处理所有事情，代码干净利落！
 
@@ -505,7 +533,7 @@ class MediaProcessor:
             return None
         try:
             cursor.execute(
-                "SELECT * FROM person_identity_map WHERE douban_celebrity_id = %s",
+                f"SELECT {PERSON_MAP_COLUMNS} FROM person_identity_map WHERE douban_celebrity_id = %s",
                 (douban_id,)
             )
             return cursor.fetchone()
@@ -513,6 +541,23 @@ class MediaProcessor:
             logger.error(f"通过豆瓣ID '{douban_id}' 查询 person_identity_map 时出错: {e}")
             return None
     
+    def _find_persons_in_map_by_douban_ids(self, douban_ids: List[Optional[str]], cursor: psycopg2.extensions.cursor) -> Dict[str, Dict[str, Any]]:
+        """
+        【批量版】一次查询取回多个豆瓣名人ID的映射记录，返回 {douban_celebrity_id: 记录}。
+        """
+        ids = list({str(douban_id) for douban_id in douban_ids if douban_id})
+        if not ids:
+            return {}
+        try:
+            cursor.execute(
+                f"SELECT {PERSON_MAP_COLUMNS} FROM person_identity_map WHERE douban_celebrity_id = ANY(%s)",
+                (ids,)
+            )
+            return {row["douban_celebrity_id"]: dict(row) for row in cursor.fetchall()}
+        except psycopg2.Error as e:
+            logger.error(f"批量通过豆瓣ID查询 person_identity_map 时出错 ({len(ids)} 个): {e}")
+            return {}
+
     # --- 通过TmdbID查找映射表 ---
     def _find_person_in_map_by_tmdb_id(self, tmdb_id: str, cursor: psycopg2.extensions.cursor) -> Optional[Dict[str, Any]]:
         """
@@ -522,7 +567,7 @@ class MediaProcessor:
             return None
         try:
             cursor.execute(
-                "SELECT * FROM person_identity_map WHERE tmdb_person_id = %s",
+                f"SELECT {PERSON_MAP_COLUMNS} FROM person_identity_map WHERE tmdb_person_id = %s",
                 (tmdb_id,)
             )
             return cursor.fetchone()
@@ -540,7 +585,7 @@ class MediaProcessor:
         try:
             # 核心改动：将查询字段从 douban_celebrity_id 改为 imdb_id
             cursor.execute(
-                "SELECT * FROM person_identity_map WHERE imdb_id = %s",
+                f"SELECT {PERSON_MAP_COLUMNS} FROM person_identity_map WHERE imdb_id = %s",
                 (imdb_id,)
             )
             return cursor.fetchone()
@@ -595,18 +640,16 @@ class MediaProcessor:
                 "provider_ids": actor.get("provider_ids")
             })
 
-        # 3. 遍历并逐个更新分集
-        # 这里仍然需要逐个更新，因为 Emby API 不支持一次性更新多个项目的演员表
-        # 但我们已经把最耗时的数据处理放在了循环外面
-        for i, episode in enumerate(episodes):
+        # 3. 并发更新分集
+        # Emby API 不支持一次性更新多个项目的演员表，只能逐个请求；
+        # 改为有界线程池并发发送，并发上限本身即起到限流作用，不再需要逐个 sleep。
+        def _update_episode(index_and_episode):
+            i, episode = index_and_episode
             if self.is_stop_requested():
-                logger.warning("分集批量更新任务被中止。")
-                break
-            
+                return
             episode_id = episode.get("Id")
             episode_name = episode.get("Name", f"分集 {i+1}")
-            logger.debug(f"  ({i+1}/{total_episodes}) 正在更新分集 '{episode_name}' (ID: {episode_id})...")
-            
+            logger.debug("  (%s/%s) 正在更新分集 '%s' (ID: %s)...", i + 1, total_episodes, episode_name, episode_id)
             emby_handler.update_emby_item_cast(
                 item_id=episode_id,
                 new_cast_list_for_handler=cast_for_emby_handler,
@@ -614,11 +657,51 @@ class MediaProcessor:
                 emby_api_key=self.emby_api_key,
                 user_id=self.emby_user_id
             )
-            # 加入一个微小的延迟，避免请求过于密集
-            time_module.sleep(0.2)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(_update_episode, pair) for pair in enumerate(episodes)]
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"  -> 更新分集演员表时出错: {e}", exc_info=True)
+
+        if self.is_stop_requested():
+            logger.warning("分集批量更新任务被中止。")
+            return
 
         logger.info(f"  -> 剧集 '{series_name}' 的分集批量更新完成。")
     
+    def _update_persons_in_emby(self, person_updates: List[Tuple[str, Dict[str, Any]]]):
+        """
+        并发地把一组 (emby_person_id, 要更新的字段) 写回 Emby。
+        每个演员都是一次独立的 HTTP 更新，彼此无依赖，用有界线程池并发发送。
+        收到停止信号后，尚未开始的更新会直接跳过。
+        """
+        if not person_updates:
+            return
+
+        def _update_person(update):
+            person_id, new_data = update
+            if self.is_stop_requested():
+                return
+            logger.trace("  -> 准备为演员 '%s' (ID: %s) 同步元数据...", new_data.get("Name"), person_id)
+            emby_handler.update_person_details(
+                person_id=person_id,
+                new_data=new_data,
+                emby_server_url=self.emby_url,
+                emby_api_key=self.emby_api_key,
+                user_id=self.emby_user_id
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(_update_person, update) for update in person_updates]
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"  -> 更新演员元数据时出错: {e}", exc_info=True)
+
     # --- 核心处理总管 ---
     def process_single_item(self, emby_item_id: str,
                             force_reprocess_this_item: bool = False,
@@ -667,6 +750,10 @@ class MediaProcessor:
             logger.error(f"项目 '{item_name_for_log}' 缺少 TMDb ID，无法处理。")
             return False
 
+        # 豆瓣数据 (本地缓存文件或在线API) 只依赖媒体详情，提前放到后台线程获取，
+        # 与阶段 1 的 Emby 请求、阶段 2 的 TMDb 请求重叠进行，阶段 3 再取结果
+        douban_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        douban_future = douban_executor.submit(self._get_douban_data_with_local_cache, item_details_from_emby)
         try:
             tmdb_details_for_cache = None
             # ======================================================================
@@ -726,7 +813,7 @@ class MediaProcessor:
             # ======================================================================
             # 阶段 3: 豆瓣及后续处理
             # ======================================================================
-            douban_cast_raw, douban_rating = self._get_douban_data_with_local_cache(item_details_from_emby)
+            douban_cast_raw, douban_rating = douban_future.result()
 
             with get_central_db_connection() as conn:
                 cursor = conn.cursor()
@@ -748,33 +835,18 @@ class MediaProcessor:
                 logger.info("  -> 写回步骤 1/2: 检查并更新演员的元数据...")
                 
                 # ★★★ 核心修正：不再依赖于电影的原始演员列表进行比较 ★★★
-                for actor in final_processed_cast:
-                    if self.is_stop_requested():
-                        raise InterruptedError("任务在演员元数据更新阶段被中止。")
-                    
-                    emby_pid = actor.get("emby_person_id")
-                    
-                    # 只处理在Emby中已存在的演员 (有Emby ID的)
-                    if not emby_pid:
-                        continue 
-
-                    # 直接构建我们期望的最终数据状态
-                    # 即使名字没变，也一起发送，Emby API会处理好
-                    data_to_update = {
+                # 只要这个演员存在于Emby (有Emby ID)，就同步其数据，确保与我们的最终结果一致；
+                # 即使名字没变，也一起发送，Emby API会处理好。这种做法更健壮，能修复各种不一致的情况。
+                person_updates = [
+                    (actor["emby_person_id"], {
                         "Name": actor.get("name"),
                         "ProviderIds": actor.get("provider_ids", {})
-                    }
-                    
-                    # 只要这个演员存在于Emby，就调用更新，确保其数据与我们的最终结果一致
-                    # 这种做法更健壮，能修复各种不一致的情况
-                    logger.trace(f"  -> 准备为演员 '{actor.get('name')}' (ID: {emby_pid}) 同步元数据...")
-                    emby_handler.update_person_details(
-                        person_id=emby_pid,
-                        new_data=data_to_update,
-                        emby_server_url=self.emby_url,
-                        emby_api_key=self.emby_api_key,
-                        user_id=self.emby_user_id
-                    )
+                    })
+                    for actor in final_processed_cast if actor.get("emby_person_id")
+                ]
+                self._update_persons_in_emby(person_updates)
+                if self.is_stop_requested():
+                    raise InterruptedError("任务在演员元数据更新阶段被中止。")
 
                 logger.info("  -> 演员元数据更新完成。")
 
@@ -852,8 +924,7 @@ class MediaProcessor:
                 # ======================================================================
                 # 阶段 7: 后续处理 (Post-processing)
                 # ======================================================================
-                genres = item_details_from_emby.get("Genres", [])
-                is_animation = "Animation" in genres or "动画" in genres or "Documentary" in genres or "纪录" in genres
+                is_animation = not _ANIMATION_LIKE_GENRES.isdisjoint(item_details_from_emby.get("Genres") or ())
                 processing_score = actor_utils.evaluate_cast_processing_quality(
                     final_cast=final_processed_cast,
                     original_cast_count=original_emby_actor_count,
@@ -861,7 +932,7 @@ class MediaProcessor:
                     is_animation=is_animation
                 )
 
-                min_score_for_review = float(self.config.get("min_score_for_review", constants.DEFAULT_MIN_SCORE_FOR_REVIEW))
+                min_score_for_review = self.min_score_for_review
                 if processing_score < min_score_for_review:
                     reason = f"处理评分 ({processing_score:.2f}) 低于阈值 ({min_score_for_review})。"
                     self.log_db_manager.remove_from_processed_log(cursor, item_id)
@@ -886,11 +957,38 @@ class MediaProcessor:
             except Exception as log_e:
                 logger.error(f"写入失败日志时再次发生错误: {log_e}")
             return False
+        finally:
+            # 中途失败/中止时：尚未开始的豆瓣请求直接取消；已在进行的等它结束，
+            # 不让后台线程在本项目处理结束后继续访问有频率限制的豆瓣接口
+            douban_future.cancel()
+            douban_executor.shutdown(wait=True)
 
         logger.info(f"✨✨✨ 处理完成 '{item_name_for_log}' ✨✨✨")
         return True
 
     # --- 核心处理器 ---
+    @staticmethod
+    def _adapt_api_person(person_data: Dict[str, Any], emby_tmdb_to_person_id_map: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        将权威数据源中的一条演员数据适配为内部统一结构，无 TMDB ID 的条目返回 None。
+        这里只做内存操作，emby_person_id 仅从当前媒体的临时映射中取。
+        """
+        if "id" in person_data:
+            tmdb_id = str(person_data["id"])
+        else:
+            tmdb_id = str((person_data.get("ProviderIds") or {}).get("Tmdb") or "")
+        if not tmdb_id or tmdb_id == 'None':
+            return None
+
+        new_actor_entry = person_data.copy()
+        new_actor_entry["emby_person_id"] = emby_tmdb_to_person_id_map.get(tmdb_id)
+
+        # 统一数据结构
+        if "id" not in new_actor_entry: new_actor_entry["id"] = tmdb_id
+        if "name" not in new_actor_entry: new_actor_entry["name"] = new_actor_entry.get("Name")
+        if "character" not in new_actor_entry: new_actor_entry["character"] = new_actor_entry.get("Role")
+        return new_actor_entry
+
     def _process_cast_list_from_api(self, tmdb_cast_people: List[Dict[str, Any]],
                                     emby_cast_people: List[Dict[str, Any]],
                                     douban_cast_list: List[Dict[str, Any]],
@@ -910,41 +1008,30 @@ class MediaProcessor:
             person.get("ProviderIds", {}).get("Tmdb"): person.get("Id")
             for person in emby_cast_people if person.get("ProviderIds", {}).get("Tmdb")
         }
-        local_cast_list = []
-        for person_data in tmdb_cast_people: # tmdb_cast_people 现在是 authoritative_cast_source
-            
-            tmdb_id = None
-            if "id" in person_data:
-                tmdb_id = str(person_data.get("id"))
-            elif "ProviderIds" in person_data and person_data.get("ProviderIds", {}).get("Tmdb"):
-                tmdb_id = str(person_data["ProviderIds"]["Tmdb"])
-            
-            if not tmdb_id or tmdb_id == 'None':
-                continue
-
-            new_actor_entry = person_data.copy()
-            
-            # 2. 优先从临时映射中获取 emby_person_id
-            emby_pid = emby_tmdb_to_person_id_map.get(tmdb_id)
-            
-            # 3. 如果临时映射中没有（说明这个演员不是当前电影的成员），则查询全局数据库
-            if not emby_pid:
-                db_entry_row = self._find_person_in_map_by_tmdb_id(tmdb_id, cursor)
-                # 2. 立即将其转换为标准的 dict 字典
-                db_entry = dict(db_entry_row) if db_entry_row else None
-                if db_entry and db_entry.get("emby_person_id"):
-                    emby_pid = db_entry["emby_person_id"]
-                    logger.trace(f"  -> 为演员 '{new_actor_entry.get('name')}' (TMDB ID: {tmdb_id}) 从全局数据库中找到了 Emby Person ID: {emby_pid}")
-
-            # 4. 将最终找到的ID（可能是None）注入
-            new_actor_entry["emby_person_id"] = emby_pid
-            
-            # 统一数据结构 (保持不变)
-            if "id" not in new_actor_entry: new_actor_entry["id"] = tmdb_id
-            if "name" not in new_actor_entry: new_actor_entry["name"] = new_actor_entry.get("Name")
-            if "character" not in new_actor_entry: new_actor_entry["character"] = new_actor_entry.get("Role")
-
-            local_cast_list.append(new_actor_entry)
+        # 先纯内存地构建适配后的演员条目，再用一次批量查询补全缺失的 emby_person_id
+        adapted = (self._adapt_api_person(p, emby_tmdb_to_person_id_map) for p in tmdb_cast_people) # tmdb_cast_people 现在是 authoritative_cast_source
+        local_cast_list = [entry for entry in adapted if entry is not None]
+
+        # 临时映射中没有的演员（不是当前媒体的成员），统一查询全局数据库
+        missing_tmdb_ids = {
+            int(entry["id"]) for entry in local_cast_list
+            if not entry["emby_person_id"] and str(entry["id"]).isdigit()
+        }
+        if missing_tmdb_ids:
+            try:
+                cursor.execute(
+                    "SELECT tmdb_person_id, emby_person_id FROM person_identity_map "
+                    "WHERE tmdb_person_id = ANY(%s) AND emby_person_id IS NOT NULL",
+                    (list(missing_tmdb_ids),)
+                )
+                db_emby_pids = {str(row["tmdb_person_id"]): row["emby_person_id"] for row in cursor.fetchall()}
+            except psycopg2.Error as e:
+                logger.error(f"批量通过 TMDB ID 查询 person_identity_map 时出错: {e}")
+                db_emby_pids = {}
+            for entry in local_cast_list:
+                if not entry["emby_person_id"] and (emby_pid := db_emby_pids.get(str(entry["id"]))):
+                    entry["emby_person_id"] = emby_pid
+                    logger.trace("  -> 为演员 '%s' (TMDB ID: %s) 从全局数据库中找到了 Emby Person ID: %s", entry.get('name'), entry['id'], emby_pid)
         
         logger.debug(f"  -> 数据适配完成，生成了 {len(local_cast_list)} 条基准演员数据。")
         # ======================================================================
@@ -953,41 +1040,49 @@ class MediaProcessor:
 
         douban_candidates = actor_utils.format_douban_cast(douban_cast_list)
 
-        unmatched_local_actors = list(local_cast_list)  # ★★★ 使用我们适配好的数据源 ★★★
         merged_actors = []
         unmatched_douban_actors = []
+        # 建立 规范化名字 (小写、去空格) -> 本地演员下标 的索引，每位豆瓣演员直接查表，
+        # 不再逐个扫描本地演员。下标按升序存放，取最小的未匹配下标即保持“按本地顺序第一个匹配者胜出”。
+        local_name_index: Dict[str, List[int]] = {}
+        for idx, l_actor in enumerate(local_cast_list):  # ★★★ 使用我们适配好的数据源 ★★★
+            local_keys = {
+                utils.to_stripped_str(l_actor.get("name")).lower(),
+                utils.to_stripped_str(l_actor.get("original_name")).lower(),
+            }
+            local_keys.discard("")
+            for key in local_keys:
+                local_name_index.setdefault(key, []).append(idx)
+        matched_local_indices = set()
         #  遍历豆瓣演员，尝试在“未匹配”的本地演员中寻找配对
         logger.debug(f" --- 匹配阶段 1: 对号入座 ---")
         for d_actor in douban_candidates:
             douban_name_zh = d_actor.get("Name", "").lower().strip()
             douban_name_en = d_actor.get("OriginalName", "").lower().strip()
 
-            match_found_for_this_douban_actor = False
-            
-            for i, l_actor in enumerate(unmatched_local_actors):
-                local_name = str(l_actor.get("name") or "").lower().strip()
-                local_original_name = str(l_actor.get("original_name") or "").lower().strip()
-                is_match, match_reason = False, ""
-                if douban_name_zh and (douban_name_zh == local_name or douban_name_zh == local_original_name):
-                    is_match, match_reason = True, "精确匹配 (豆瓣中文名)"
-                elif douban_name_en and (douban_name_en == local_name or douban_name_en == local_original_name):
-                    is_match, match_reason = True, "精确匹配 (豆瓣外文名)"
-                
-                if is_match:
-                    logger.debug(f"  -> 匹配成功： (对号入座): 豆瓣演员 '{d_actor.get('Name')}' -> 本地演员 '{l_actor.get('name')}' (ID: {l_actor.get('id')})")
+            candidate_indices = [
+                idx
+                for key in (douban_name_zh, douban_name_en) if key
+                for idx in local_name_index.get(key, ())
+                if idx not in matched_local_indices
+            ]
+            if not candidate_indices:
+                unmatched_douban_actors.append(d_actor)
+                continue
 
-                    l_actor["name"] = d_actor.get("Name")
-                    cleaned_douban_character = utils.clean_character_name_static(d_actor.get("Role"))
-                    l_actor["character"] = actor_utils.select_best_role(l_actor.get("character"), cleaned_douban_character)
-                    if d_actor.get("DoubanCelebrityId"):
-                        l_actor["douban_id"] = d_actor.get("DoubanCelebrityId")
+            i = min(candidate_indices)
+            matched_local_indices.add(i)
+            l_actor = local_cast_list[i]
+            logger.debug("  -> 匹配成功： (对号入座): 豆瓣演员 '%s' -> 本地演员 '%s' (ID: %s)", d_actor.get('Name'), l_actor.get('name'), l_actor.get('id'))
 
-                    merged_actors.append(unmatched_local_actors.pop(i))
-                    match_found_for_this_douban_actor = True
-                    break
+            l_actor["name"] = d_actor.get("Name")
+            cleaned_douban_character = utils.clean_character_name_static(d_actor.get("Role"))
+            l_actor["character"] = actor_utils.select_best_role(l_actor.get("character"), cleaned_douban_character)
+            if d_actor.get("DoubanCelebrityId"):
+                l_actor["douban_id"] = d_actor.get("DoubanCelebrityId")
+            merged_actors.append(l_actor)
 
-            if not match_found_for_this_douban_actor:
-                unmatched_douban_actors.append(d_actor)
+        unmatched_local_actors = [a for idx, a in enumerate(local_cast_list) if idx not in matched_local_indices]
 
         # 1. 先将已有的演员（匹配合并的 + 未匹配的本地演员）构成当前的演员列表基础
         current_cast_list = merged_actors + unmatched_local_actors
@@ -1016,17 +1111,21 @@ class MediaProcessor:
                 logger.info(f"  -> 当前演员数 ({current_actor_count}) 低于上限 ({limit})，进入补充模式（处理来自豆瓣的新增演员）。")
                 logger.debug(f" --- 匹配阶段 2: 用豆瓣ID查'演员映射表' ({len(unmatched_douban_actors)} 位演员) ---")
                 still_unmatched = []
-                for d_actor in unmatched_douban_actors:
-                    if self.is_stop_requested(): raise InterruptedError("任务中止")
+                # 所有豆瓣ID的映射记录用一次查询取回，循环中只查字典
+                entries_by_douban_id = self._find_persons_in_map_by_douban_ids(
+                    [d_actor.get("DoubanCelebrityId") for d_actor in unmatched_douban_actors], cursor
+                )
+                for i, d_actor in enumerate(unmatched_douban_actors):
+                    # 本循环只有内存查找，每 16 位演员检查一次停止信号即可
+                    if (i & 15) == 0 and self._stop_event.is_set(): raise InterruptedError("任务中止")
                     d_douban_id = d_actor.get("DoubanCelebrityId")
                     match_found = False
                     if d_douban_id:
-                        entry_row = self._find_person_in_map_by_douban_id(d_douban_id, cursor)
-                        entry = dict(entry_row) if entry_row else None
+                        entry = entries_by_douban_id.get(str(d_douban_id))
                         if entry and entry.get("tmdb_person_id"):
                             tmdb_id_from_map = str(entry.get("tmdb_person_id"))
                             if tmdb_id_from_map not in final_cast_map:
-                                logger.debug(f"  -> 匹配成功 (通过 豆瓣ID映射): 豆瓣演员 '{d_actor.get('Name')}' -> 加入最终演员表")
+                                logger.debug("  -> 匹配成功 (通过 豆瓣ID映射): 豆瓣演员 '%s' -> 加入最终演员表", d_actor.get('Name'))
                                 cached_metadata = self._get_actor_metadata_from_cache(tmdb_id_from_map, cursor) or {}
                                 new_actor_entry = {
                                     "id": tmdb_id_from_map, "name": d_actor.get("Name"),
@@ -1046,92 +1145,113 @@ class MediaProcessor:
 
                 logger.debug(f" --- 匹配阶段 3: 用IMDb ID进行最终匹配和新增 ({len(unmatched_douban_actors)} 位演员) ---")
                 still_unmatched_final = []
-                for i, d_actor in enumerate(unmatched_douban_actors):
-                    if self.is_stop_requested(): raise InterruptedError("任务中止")
-                    if len(final_cast_map) >= limit:
-                        logger.info(f"  -> 演员数已达上限 ({limit})，跳过剩余 {len(unmatched_douban_actors) - i} 位演员的API查询。")
-                        still_unmatched_final.extend(unmatched_douban_actors[i:])
-                        break
-                    d_douban_id = d_actor.get("DoubanCelebrityId")
-                    match_found = False
-                    if d_douban_id and self.douban_api and self.tmdb_api_key:
+                # TMDb 反查放到后台线程，与下一位演员的豆瓣请求 (及其限速等待) 重叠进行。
+                # 待定的反查结果总是按演员原顺序合并；在任何需要读取 final_cast_map 的判断之前先合并，
+                # 因此结果与逐个串行处理完全一致。
+                pending_lookups = []
+
+                def _apply_tmdb_lookup(d_actor, d_imdb_id, d_douban_id, person_from_tmdb) -> bool:
+                    if not (person_from_tmdb and person_from_tmdb.get("id")):
+                        return False
+                    tmdb_id_from_find = str(person_from_tmdb.get("id"))
+                    if tmdb_id_from_find not in final_cast_map:
+                        logger.debug("  -> 匹配成功 (通过 TMDb反查): 豆瓣演员 '%s' -> 加入最终演员表", d_actor.get('Name'))
+                        emby_pid_from_final_check = None
+                        final_check_row = self._find_person_in_map_by_tmdb_id(tmdb_id_from_find, cursor)
+                        if final_check_row:
+                            final_check_entry = dict(final_check_row)
+                            emby_pid_from_final_check = final_check_entry.get("emby_person_id")
+                            if emby_pid_from_final_check:
+                                logger.trace("  -> [最终检查] 发现该TMDB ID已关联Emby Person ID: %s", emby_pid_from_final_check)
+                        cached_metadata = self._get_actor_metadata_from_cache(tmdb_id_from_find, cursor) or {}
+                        new_actor_entry = {
+                            "id": tmdb_id_from_find, "name": d_actor.get("Name"),
+                            "original_name": cached_metadata.get("original_name") or d_actor.get("OriginalName"),
+                            "character": d_actor.get("Role"), "adult": cached_metadata.get("adult", False),
+                            "gender": cached_metadata.get("gender", 0), "known_for_department": "Acting",
+                            "popularity": cached_metadata.get("popularity", 0.0), "profile_path": cached_metadata.get("profile_path"),
+                            "cast_id": None, "credit_id": None, "order": 999,
+                            "imdb_id": d_imdb_id, "douban_id": d_douban_id,
+                            "emby_person_id": emby_pid_from_final_check, "_is_newly_added": True
+                        }
+                        final_cast_map[tmdb_id_from_find] = new_actor_entry
+                    return True
+
+                def _drain_pending_lookups():
+                    for p_actor, p_imdb_id, p_douban_id, future in pending_lookups:
+                        if not _apply_tmdb_lookup(p_actor, p_imdb_id, p_douban_id, future.result()):
+                            still_unmatched_final.append(p_actor)
+                    pending_lookups.clear()
+
+                with concurrent.futures.ThreadPoolExecutor(max_workers=4) as tmdb_executor:
+                    for i, d_actor in enumerate(unmatched_douban_actors):
                         if self.is_stop_requested(): raise InterruptedError("任务中止")
-                        details = self.douban_api.celebrity_details(d_douban_id)
-                        time_module.sleep(0.3)
-                        d_imdb_id = None
-                        if details and not details.get("error"):
-                            try:
-                                info_list = details.get("extra", {}).get("info", [])
-                                if isinstance(info_list, list):
-                                    for item in info_list:
-                                        if isinstance(item, list) and len(item) == 2 and item[0] == 'IMDb编号':
-                                            d_imdb_id = item[1]
-                                            break
-                            except Exception as e_parse:
-                                logger.warning(f"  -> 解析 IMDb ID 时发生意外错误: {e_parse}")
-                        if d_imdb_id:
-                            logger.debug(f"  -> 为 '{d_actor.get('Name')}' 获取到 IMDb ID: {d_imdb_id}，开始匹配...")
-                            entry_row_from_map = self._find_person_in_map_by_imdb_id(d_imdb_id, cursor)
-                            entry_from_map = dict(entry_row_from_map) if entry_row_from_map else None
-                            if entry_from_map and entry_from_map.get("tmdb_person_id"):
-                                tmdb_id_from_map = str(entry_from_map.get("tmdb_person_id"))
-                                if tmdb_id_from_map not in final_cast_map:
-                                    logger.debug(f"  -> 匹配成功 (通过 IMDb映射): 豆瓣演员 '{d_actor.get('Name')}' -> 加入最终演员表")
-                                    cached_metadata = self._get_actor_metadata_from_cache(tmdb_id_from_map, cursor) or {}
-                                    new_actor_entry = {
-                                        "id": tmdb_id_from_map, "name": d_actor.get("Name"),
-                                        "original_name": cached_metadata.get("original_name") or d_actor.get("OriginalName"),
-                                        "character": d_actor.get("Role"), "order": 999, "imdb_id": d_imdb_id,
-                                        "douban_id": d_douban_id, "emby_person_id": entry_from_map.get("emby_person_id"),
-                                        "_is_newly_added": True
-                                    }
-                                    final_cast_map[tmdb_id_from_map] = new_actor_entry
-                                match_found = True
-                            if not match_found:
-                                logger.debug(f"  -> 数据库未找到 {d_imdb_id} 的映射，开始通过 TMDb API 反查...")
-                                if self.is_stop_requested(): raise InterruptedError("任务中止")
-                                name_for_verification = d_actor.get("OriginalName")
-                                log_source = "豆瓣"
+                        if pending_lookups and len(final_cast_map) + len(pending_lookups) >= limit:
+                            _drain_pending_lookups()
+                        if len(final_cast_map) >= limit:
+                            logger.info(f"  -> 演员数已达上限 ({limit})，跳过剩余 {len(unmatched_douban_actors) - i} 位演员的API查询。")
+                            still_unmatched_final.extend(unmatched_douban_actors[i:])
+                            break
+                        d_douban_id = d_actor.get("DoubanCelebrityId")
+                        match_found = False
+                        if d_douban_id and self.douban_api and self.tmdb_api_key:
+                            if self.is_stop_requested(): raise InterruptedError("任务中止")
+                            details = self.douban_api.celebrity_details(d_douban_id)
+                            time_module.sleep(0.3)
+                            d_imdb_id = None
+                            if details and not details.get("error"):
+                                try:
+                                    info_list = details.get("extra", {}).get("info", [])
+                                    if isinstance(info_list, list):
+                                        for item in info_list:
+                                            if isinstance(item, list) and len(item) == 2 and item[0] == 'IMDb编号':
+                                                d_imdb_id = item[1]
+                                                break
+                                except Exception as e_parse:
+                                    logger.warning(f"  -> 解析 IMDb ID 时发生意外错误: {e_parse}")
+                            if d_imdb_id:
+                                logger.debug("  -> 为 '%s' 获取到 IMDb ID: %s，开始匹配...", d_actor.get('Name'), d_imdb_id)
+                                entry_row_from_map = self._find_person_in_map_by_imdb_id(d_imdb_id, cursor)
+                                entry_from_map = dict(entry_row_from_map) if entry_row_from_map else None
                                 if entry_from_map and entry_from_map.get("tmdb_person_id"):
+                                    _drain_pending_lookups()
                                     tmdb_id_from_map = str(entry_from_map.get("tmdb_person_id"))
-                                    cached_metadata = self._get_actor_metadata_from_cache(tmdb_id_from_map, cursor)
-                                    if cached_metadata and cached_metadata.get("original_name"):
-                                        name_for_verification = cached_metadata.get("original_name")
-                                        log_source = "本地数据库"
-                                        logger.debug(f"  -> [验证准备] 成功从本地数据库为 TMDb ID {tmdb_id_from_map} 找到用于验证的 original_name: '{name_for_verification}'")
-                                logger.debug(f"  -> 将使用来自 [{log_source}] 的外文名 '{name_for_verification}' 进行 TMDb API 匹配验证。")
-                                names_to_verify = {"chinese_name": d_actor.get("Name"), "original_name": name_for_verification}
-                                person_from_tmdb = tmdb_handler.find_person_by_external_id(
-                                    external_id=d_imdb_id, api_key=self.tmdb_api_key, source="imdb_id",
-                                    names_for_verification=names_to_verify
-                                )
-                                if person_from_tmdb and person_from_tmdb.get("id"):
-                                    tmdb_id_from_find = str(person_from_tmdb.get("id"))
-                                    if tmdb_id_from_find not in final_cast_map:
-                                        logger.debug(f"  -> 匹配成功 (通过 TMDb反查): 豆瓣演员 '{d_actor.get('Name')}' -> 加入最终演员表")
-                                        emby_pid_from_final_check = None
-                                        final_check_row = self._find_person_in_map_by_tmdb_id(tmdb_id_from_find, cursor)
-                                        if final_check_row:
-                                            final_check_entry = dict(final_check_row)
-                                            emby_pid_from_final_check = final_check_entry.get("emby_person_id")
-                                            if emby_pid_from_final_check:
-                                                logger.trace(f"  -> [最终检查] 发现该TMDB ID已关联Emby Person ID: {emby_pid_from_final_check}")
-                                        cached_metadata = self._get_actor_metadata_from_cache(tmdb_id_from_find, cursor) or {}
+                                    if tmdb_id_from_map not in final_cast_map:
+                                        logger.debug("  -> 匹配成功 (通过 IMDb映射): 豆瓣演员 '%s' -> 加入最终演员表", d_actor.get('Name'))
+                                        cached_metadata = self._get_actor_metadata_from_cache(tmdb_id_from_map, cursor) or {}
                                         new_actor_entry = {
-                                            "id": tmdb_id_from_find, "name": d_actor.get("Name"),
+                                            "id": tmdb_id_from_map, "name": d_actor.get("Name"),
                                             "original_name": cached_metadata.get("original_name") or d_actor.get("OriginalName"),
-                                            "character": d_actor.get("Role"), "adult": cached_metadata.get("adult", False),
-                                            "gender": cached_metadata.get("gender", 0), "known_for_department": "Acting",
-                                            "popularity": cached_metadata.get("popularity", 0.0), "profile_path": cached_metadata.get("profile_path"),
-                                            "cast_id": None, "credit_id": None, "order": 999,
-                                            "imdb_id": d_imdb_id, "douban_id": d_douban_id,
-                                            "emby_person_id": emby_pid_from_final_check, "_is_newly_added": True
+                                            "character": d_actor.get("Role"), "order": 999, "imdb_id": d_imdb_id,
+                                            "douban_id": d_douban_id, "emby_person_id": entry_from_map.get("emby_person_id"),
+                                            "_is_newly_added": True
                                         }
-                                        final_cast_map[tmdb_id_from_find] = new_actor_entry
-                                        
+                                        final_cast_map[tmdb_id_from_map] = new_actor_entry
                                     match_found = True
-                    if not match_found:
-                        still_unmatched_final.append(d_actor)
+                                if not match_found:
+                                    logger.debug("  -> 数据库未找到 %s 的映射，开始通过 TMDb API 反查...", d_imdb_id)
+                                    if self.is_stop_requested(): raise InterruptedError("任务中止")
+                                    name_for_verification = d_actor.get("OriginalName")
+                                    log_source = "豆瓣"
+                                    if entry_from_map and entry_from_map.get("tmdb_person_id"):
+                                        tmdb_id_from_map = str(entry_from_map.get("tmdb_person_id"))
+                                        cached_metadata = self._get_actor_metadata_from_cache(tmdb_id_from_map, cursor)
+                                        if cached_metadata and cached_metadata.get("original_name"):
+                                            name_for_verification = cached_metadata.get("original_name")
+                                            log_source = "本地数据库"
+                                            logger.debug("  -> [验证准备] 成功从本地数据库为 TMDb ID %s 找到用于验证的 original_name: '%s'", tmdb_id_from_map, name_for_verification)
+                                    logger.debug("  -> 将使用来自 [%s] 的外文名 '%s' 进行 TMDb API 匹配验证。", log_source, name_for_verification)
+                                    names_to_verify = {"chinese_name": d_actor.get("Name"), "original_name": name_for_verification}
+                                    future = tmdb_executor.submit(
+                                        tmdb_handler.find_person_by_external_id,
+                                        external_id=d_imdb_id, api_key=self.tmdb_api_key, source="imdb_id",
+                                        names_for_verification=names_to_verify
+                                    )
+                                    pending_lookups.append((d_actor, d_imdb_id, d_douban_id, future))
+                                    continue
+                        if not match_found:
+                            still_unmatched_final.append(d_actor)
+                    _drain_pending_lookups()
                 if still_unmatched_final:
                     discarded_names = [d.get('Name') for d in still_unmatched_final]
                     logger.info(f"  -> 最终丢弃 {len(still_unmatched_final)} 位豆瓣演员 ---")
@@ -1152,9 +1272,8 @@ class MediaProcessor:
         original_count = len(current_cast_list)
         if original_count > limit:
             logger.info(f"  -> 演员列表总数 ({original_count}) 超过上限 ({limit})，将在翻译前进行截断。")
-            # 按 order 排序
-            current_cast_list.sort(key=lambda x: x.get('order') if x.get('order') is not None and x.get('order') >= 0 else 999)
-            cast_to_process = current_cast_list[:limit]
+            # 按 order 取前 limit 位：只需部分排序，heapq.nsmallest 与 sorted(...)[:limit] 结果一致（稳定）
+            cast_to_process = heapq.nsmallest(limit, current_cast_list, key=_cast_order_key)
         else:
             cast_to_process = current_cast_list
 
@@ -1163,35 +1282,45 @@ class MediaProcessor:
         # ======================================================================
         # 步骤 4: ★★★ 三级翻译流程 ★★★
         # ======================================================================
-        if not (self.ai_translator and self.config.get(constants.CONFIG_OPTION_AI_TRANSLATION_ENABLED, False)):
+        if not self.config.get(constants.CONFIG_OPTION_AI_TRANSLATION_ENABLED, False):
             logger.info("  -> AI翻译未启用，将保留演员和角色名原文。")
         else:
             # --- 数据准备 ---
             final_translation_map = {} # 存储所有最终的翻译结果
             
-            # 1. 收集所有需要翻译的词条
+            # 1. 收集所有需要翻译的词条；清洗后的角色名按演员顺序保存，应用结果时直接复用
             terms_to_translate = set()
+            cleaned_characters = []
             for actor in cast_to_process:
                 name = actor.get('name')
                 if name and not utils.contains_chinese(name):
                     terms_to_translate.add(name)
                 character = actor.get('character')
-                if character:
-                    cleaned_character = utils.clean_character_name_static(character)
-                    if cleaned_character and not utils.contains_chinese(cleaned_character):
-                        terms_to_translate.add(cleaned_character)
+                cleaned_character = utils.clean_character_name_static(character) if character else ''
+                cleaned_characters.append(cleaned_character)
+                if cleaned_character and not utils.contains_chinese(cleaned_character):
+                    terms_to_translate.add(cleaned_character)
             
             remaining_terms = list(terms_to_translate)
+            # 先收集再触碰 self.ai_translator：全部已是中文时（重复处理时很常见）连翻译器都不必初始化
+            ai_unavailable = False
+            if not remaining_terms:
+                logger.info("  -> 所有演员名和角色名均已是中文，跳过AI翻译。")
+            elif self.ai_translator is None:
+                logger.info("  -> AI翻译器不可用，将保留演员和角色名原文。")
+                remaining_terms, ai_unavailable = [], True
 
             # --- 🚀 第一级: 翻译官模式 (带全局缓存) ---
             if remaining_terms:
                 logger.info(f"--- 第一级翻译开始: 快速模式处理 {len(remaining_terms)} 个词条 ---")
                 
                 # 1.1 查缓存
+                # 一次查询取回所有词条的缓存，避免逐个词条查询数据库
+                cached_entries = self.actor_db_manager.get_translations_from_db(cursor, remaining_terms)
                 cached_results = {}
                 terms_for_api = []
                 for term in remaining_terms:
-                    cached = self.actor_db_manager.get_translation_from_db(cursor, term)
+                    cached = cached_entries.get(term)
                     if cached and cached.get('translated_text'):
                         cached_results[term] = cached['translated_text']
                     else:
@@ -1207,9 +1336,8 @@ class MediaProcessor:
                     fast_api_results = self.ai_translator.batch_translate(terms_for_api, mode='fast')
                     
                     # 1.3 处理API结果并回写缓存
-                    for term, translation in fast_api_results.items():
-                        final_translation_map[term] = translation
-                        self.actor_db_manager.save_translation_to_db(cursor, term, translation, self.ai_translator.provider)
+                    final_translation_map.update(fast_api_results)
+                    self.actor_db_manager.save_translations_to_db(cursor, fast_api_results, self.ai_translator.provider)
 
                 # 1.4 筛选失败者
                 failed_terms = []
@@ -1246,18 +1374,17 @@ class MediaProcessor:
                 final_translation_map.update(quality_results) # 最终信任顾问的结果
             
             # --- 应用所有翻译结果 ---
-            logger.info("------------ AI翻译流程成功，开始应用结果 ------------")
-            for actor in cast_to_process:
-                original_name = actor.get('name')
-                actor['name'] = final_translation_map.get(original_name, original_name)
-                
-                original_character = actor.get('character')
-                if original_character:
-                    cleaned_character = utils.clean_character_name_static(original_character)
-                    actor['character'] = final_translation_map.get(cleaned_character, cleaned_character)
-                else:
-                    actor['character'] = ''
-            logger.info("----------------------------------------------------")
+            if not ai_unavailable:
+                logger.info("------------ AI翻译流程成功，开始应用结果 ------------")
+                for actor, cleaned_character in zip(cast_to_process, cleaned_characters):
+                    original_name = actor.get('name')
+                    actor['name'] = final_translation_map.get(original_name, original_name)
+                    
+                    if cleaned_character:
+                        actor['character'] = final_translation_map.get(cleaned_character, cleaned_character)
+                    else:
+                        actor['character'] = ''
+                logger.info("----------------------------------------------------")
 
         # ======================================================================
         # 步骤 5: 格式化最终演员表
@@ -1273,8 +1400,7 @@ class MediaProcessor:
         # 5.2: 正常调用格式化函数 (黑盒)
         logger.trace("调用 actor_utils.format_and_complete_cast_list 进行格式化...")
         
-        genres = item_details_from_emby.get("Genres", [])
-        is_animation = "Animation" in genres or "动画" in genres or "Documentary" in genres or "纪录" in genres
+        is_animation = not _ANIMATION_LIKE_GENRES.isdisjoint(item_details_from_emby.get("Genres") or ())
         
         final_cast_perfect = actor_utils.format_and_complete_cast_list(
             cast_to_process, is_animation, self.config, mode='auto'
@@ -1299,7 +1425,7 @@ class MediaProcessor:
                 "Douban": actor.get("douban_id")
             }
             if actor.get("emby_person_id"):
-                logger.trace(f"  演员 '{actor.get('name')}' 最终保留了 Emby Person ID: {actor.get('emby_person_id')}")
+                logger.trace("  演员 '%s' 最终保留了 Emby Person ID: %s", actor.get('name'), actor.get('emby_person_id'))
 
         return final_cast_perfect
 
@@ -1331,8 +1457,13 @@ class MediaProcessor:
         all_emby_libraries = emby_handler.get_emby_libraries(self.emby_url, self.emby_api_key, self.emby_user_id) or []
         library_name_map = {lib.get('Id'): lib.get('Name', '未知库名') for lib in all_emby_libraries}
         
-        movies = emby_handler.get_emby_library_items(self.emby_url, self.emby_api_key, "Movie", self.emby_user_id, libs_to_process_ids, library_name_map=library_name_map) or []
-        series = emby_handler.get_emby_library_items(self.emby_url, self.emby_api_key, "Series", self.emby_user_id, libs_to_process_ids, library_name_map=library_name_map) or []
+        # 电影和剧集用一次请求取回，且只请求遍历时用到的字段 (默认字段含 People 等大体积数据)
+        library_items = emby_handler.get_emby_library_items(
+            self.emby_url, self.emby_api_key, "Movie,Series", self.emby_user_id, libs_to_process_ids,
+            library_name_map=library_name_map, fields="Id,Name,Type"
+        ) or []
+        movies = [item for item in library_items if item.get('Type') == "Movie"]
+        series = [item for item in library_items if item.get('Type') == "Series"]
         
         if movies:
             source_movie_lib_names = sorted(list({library_name_map.get(item.get('_SourceLibraryId')) for item in movies if item.get('_SourceLibraryId')}))
@@ -1343,26 +1474,34 @@ class MediaProcessor:
             logger.info(f"从媒体库【{', '.join(source_series_lib_names)}】获取到 {len(series)} 个电视剧项目。")
 
         all_items = movies + series
-        total = len(all_items)
         # --- ★★★ 补全结束 ★★★ ---
         
-        if total == 0:
+        if not all_items:
             logger.info("在所有选定的库中未找到任何可处理的项目。")
             if update_status_callback: update_status_callback(100, "未找到可处理的项目。")
             return
 
+        # 已处理的项目在遍历前一次性滤掉，不再逐个输出跳过日志和进度
+        if not force_reprocess_all:
+            processed_cache = self.processed_items_cache
+            pending_items = [item for item in all_items if item.get('Id') not in processed_cache]
+            skipped_count = len(all_items) - len(pending_items)
+            if skipped_count:
+                logger.info(f"跳过 {skipped_count} 个已处理的项目，剩余 {len(pending_items)} 个待处理。")
+            all_items = pending_items
+
+        total = len(all_items)
+        if total == 0:
+            logger.info("所有项目均已处理过，无需再次处理。")
+            if update_status_callback: update_status_callback(100, "所有项目均已处理。")
+            return
+
         for i, item in enumerate(all_items):
             if self.is_stop_requested(): break
             
             item_id = item.get('Id')
             item_name = item.get('Name', f"ID:{item_id}")
 
-            if not force_reprocess_all and item_id in self.processed_items_cache:
-                logger.info(f"正在跳过已处理的项目: {item_name}")
-                if update_status_callback:
-                    update_status_callback(int(((i + 1) / total) * 100), f"跳过: {item_name}")
-                continue
-
             if update_status_callback:
                 update_status_callback(int(((i + 1) / total) * 100), f"处理中 ({i+1}/{total}): {item_name}")
             
@@ -1372,7 +1511,7 @@ class MediaProcessor:
                 force_fetch_from_tmdb=force_fetch_from_tmdb
             )
             
-            time_module.sleep(float(self.config.get("delay_between_items_sec", 0.5)))
+            time_module.sleep(self.delay_between_items)
         
         if not self.is_stop_requested() and update_status_callback:
             update_status_callback(100, "全量处理完成")
@@ -1407,24 +1546,25 @@ class MediaProcessor:
                 translation_cache = {} # 本次运行的内存缓存
                 texts_to_translate = set()
 
-                # 1. 收集所有需要翻译的词条
+                # 1. 收集所有需要翻译的词条；每位演员的 (名字, 清洗后角色名) 保存下来，回填时直接复用
                 texts_to_collect = set()
+                actor_terms = []
                 for actor in translated_cast:
-                    for field_key in ['name', 'role']:
-                        text = actor.get(field_key, '').strip()
-                        if field_key == 'role':
-                            # 无论是演员名还是角色名，都先清洗一遍，确保拿到的是核心文本
-                            # 对于演员名，这个清洗通常无影响，但对于角色名至关重要
-                            text = utils.clean_character_name_static(text)
+                    name_text = actor.get('name', '').strip()
+                    # 角色名先清洗一遍，确保拿到的是核心文本
+                    role_text = utils.clean_character_name_static(actor.get('role', '').strip())
+                    actor_terms.append((name_text, role_text))
+                    for text in (name_text, role_text):
                         if text and not utils.contains_chinese(text):
                             texts_to_collect.add(text)
 
                 # 2. 根据模式决定是否使用缓存
                 if translation_mode == 'fast':
                     logger.debug("[翻译模式] 正在检查全局翻译缓存...")
+                    # 翻译模式只读写全局缓存，一次查询取回全部词条
+                    cached_entries = self.actor_db_manager.get_translations_from_db(cursor, list(texts_to_collect))
                     for text in texts_to_collect:
-                        # 翻译模式只读写全局缓存
-                        cached_entry = self.actor_db_manager.get_translation_from_db(cursor=cursor, text=text)
+                        cached_entry = cached_entries.get(text)
                         if cached_entry:
                             translation_cache[text] = cached_entry.get("translated_text")
                         else:
@@ -1448,13 +1588,11 @@ class MediaProcessor:
                             
                             # 只有在翻译模式下，才将结果写入全局缓存
                             if translation_mode == 'fast':
-                                for original, translated in translation_map_from_api.items():
-                                    self.actor_db_manager.save_translation_to_db(
-                                        cursor=cursor,
-                                        original_text=original, 
-                                        translated_text=translated, 
-                                        engine_used=self.ai_translator.provider
-                                    )
+                                self.actor_db_manager.save_translations_to_db(
+                                    cursor=cursor,
+                                    translations=translation_map_from_api,
+                                    engine_used=self.ai_translator.provider
+                                )
                             
                             ai_translation_succeeded = True
                         else:
@@ -1467,16 +1605,11 @@ class MediaProcessor:
 
                 # 4. 回填所有翻译结果
                 if translation_cache:
-                    for i, actor in enumerate(translated_cast):
-                        original_name = actor.get('name', '').strip()
+                    for i, (actor, (original_name, cleaned_original_role)) in enumerate(zip(translated_cast, actor_terms)):
                         if original_name in translation_cache:
                             translated_cast[i]['name'] = translation_cache[original_name]
                         
-                        original_role_raw = actor.get('role', '').strip()
-                        # 使用与收集时完全相同的清理逻辑
-                        cleaned_original_role = utils.clean_character_name_static(original_role_raw)
-                        
-                        # 用清理后的名字作为key去查找
+                        # 用收集时清理后的名字作为key去查找
                         if cleaned_original_role in translation_cache:
                             translated_cast[i]['role'] = translation_cache[cleaned_original_role]
                         
@@ -1495,37 +1628,48 @@ class MediaProcessor:
                 with get_central_db_connection() as conn:
                     cursor = conn.cursor()
 
+                    # 先用一次批量查询预热翻译缓存，随后逐个调用 translate_actor_field 时
+                    # 其内部的单条缓存查询可直接命中内存，不再逐条访问数据库
+                    prefetch_terms = {
+                        text.strip()
+                        for actor in translated_cast
+                        for text in (actor.get('name'), actor.get('role'))
+                        if text and text.strip() and not utils.contains_chinese(text)
+                    }
+                    if prefetch_terms:
+                        self.actor_db_manager.get_translations_from_db(cursor, list(prefetch_terms))
+
+                    # 同一词条（如常见角色名）在演员表中可能出现多次，每个去重后的词条只翻译一次，回填时直接查表
+                    translated_terms: Dict[str, Optional[str]] = {}
+
+                    def translate_term(text: str) -> Optional[str]:
+                        if text not in translated_terms:
+                            translated_terms[text] = actor_utils.translate_actor_field(
+                                text=text,
+                                db_manager=self.actor_db_manager,
+                                db_cursor=cursor,
+                                ai_translator=self.ai_translator,
+                                translator_engines=self.translator_engines,
+                                ai_enabled=self.ai_enabled
+                            )
+                        return translated_terms[text]
+
                     for i, actor in enumerate(translated_cast):
                         if self.is_stop_requested():
                             logger.warning(f"一键翻译（降级模式）被用户中止。")
                             break # 这里使用 break 更安全，可以直接跳出循环
-                        # 【【【 修复点 3：使用正确的参数调用 translate_actor_field 】】】
-                        
+
                         # 翻译演员名
                         name_to_translate = actor.get('name', '').strip()
                         if name_to_translate and not utils.contains_chinese(name_to_translate):
-                            translated_name = actor_utils.translate_actor_field(
-                                text=name_to_translate,
-                                db_manager=self.actor_db_manager,
-                                db_cursor=cursor,
-                                ai_translator=self.ai_translator,
-                                translator_engines=self.translator_engines,
-                                ai_enabled=self.ai_enabled
-                            )
+                            translated_name = translate_term(name_to_translate)
                             if translated_name and translated_name != name_to_translate:
                                 translated_cast[i]['name'] = translated_name
 
                         # 翻译角色名
                         role_to_translate = actor.get('role', '').strip()
                         if role_to_translate and not utils.contains_chinese(role_to_translate):
-                            translated_role = actor_utils.translate_actor_field(
-                                text=role_to_translate,
-                                db_manager=self.actor_db_manager,
-                                db_cursor=cursor,
-                                ai_translator=self.ai_translator,
-                                translator_engines=self.translator_engines,
-                                ai_enabled=self.ai_enabled
-                            )
+                            translated_role = translate_term(role_to_translate)
                             if translated_role and translated_role != role_to_translate:
                                 translated_cast[i]['role'] = translated_role
 
@@ -1631,16 +1775,16 @@ class MediaProcessor:
             # 2.1: 前置更新演员名
             logger.info("  -> 手动处理：步骤 1/2: 检查并更新演员名字...")
             original_names_map = {p.get("Id"): p.get("Name") for p in item_details.get("People", []) if p.get("Id")}
+            name_updates = []
             for actor in cast_for_emby_handler:
                 actor_id = actor.get("emby_person_id")
                 new_name = actor.get("name")
                 original_name = original_names_map.get(actor_id)
                 if actor_id and new_name and original_name and new_name != original_name:
                     logger.info(f"  -> 检测到手动名字变更，正在更新 Person: '{original_name}' -> '{new_name}' (ID: {actor_id})")
-                    emby_handler.update_person_details(
-                        person_id=actor_id, new_data={"Name": new_name},
-                        emby_server_url=self.emby_url, emby_api_key=self.emby_api_key, user_id=self.emby_user_id
-                    )
+                    name_updates.append((actor_id, {"Name": new_name}))
+            # 没有名字变更时不发起任何请求；有变更时并发提交
+            self._update_persons_in_emby(name_updates)
             logger.info("  -> 手动处理：演员名字前置更新完成。")
 
             # 2.2: 更新媒体主项目的演员列表
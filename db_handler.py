@@ -1,9 +1,13 @@
 # db_handler.py
 import psycopg2
-from psycopg2.extras import RealDictCursor # 关键：让查询结果返回字典
+from psycopg2.extras import RealDictCursor, execute_values # 关键：让查询结果返回字典
 import json
+import threading
+import functools
+import time
 from datetime import date, timedelta, datetime
 import logging
+from cachetools import LRUCache
 from typing import Optional, Dict, Any, List, Tuple
 from flask import jsonify
 
@@ -27,11 +31,103 @@ STATUS_TRANSLATION_MAP = {
     'pending_release': '未上映' # 确保这个状态也有翻译
 }
 
+# 会话级参数 lock_timeout：与其他任务争用同一行时最多等待 30 秒，而不是无限期阻塞。
+_SESSION_OPTIONS = "-c lock_timeout=30s"
+
+def raise_sort_memory(cursor: psycopg2.extensions.cursor):
+    """
+    仅对当前事务调高 work_mem，让演员映射表上的大排序/哈希（如补充任务中的 LEFT JOIN + ORDER BY）
+    在内存中完成，不落临时文件。页缓存 (shared_buffers) 属于服务端配置，不在此处设置。
+    """
+    cursor.execute("SET LOCAL work_mem = '32MB'")
+
+def relax_commit_durability(cursor: psycopg2.extensions.cursor):
+    """
+    仅对当前事务关闭 synchronous_commit：提交时不等待 WAL 刷盘，批量写入不再被逐次 fsync 拖慢。
+    数据库崩溃时最多丢失最近几百毫秒的提交，但不会造成数据损坏。
+    只能用于写入内容可由同步/补充任务重建的事务（演员映射、演员元数据），每个事务开始时调用一次。
+    """
+    cursor.execute("SET LOCAL synchronous_commit = off")
+
+class _ReusableConnection(psycopg2.extensions.connection):
+    """记录 with 块的嵌套深度，只有不在任何 with 块中的空闲连接才会被同一线程复用。"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.in_use_depth = 0
+        self.released_at = time.monotonic()
+        # 在 with 块内被要求关闭时先打上标记，等最外层 with 块退出后再真正关闭
+        self.close_when_released = False
+
+    def __enter__(self):
+        conn = super().__enter__()
+        self.in_use_depth += 1
+        return conn
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.in_use_depth -= 1
+        try:
+            return super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            if exc_type is not None:
+                # 异常退出时事务被回滚，事务内读入查找缓存的记录可能从未提交
+                ActorDBManager.clear_person_cache()
+            if self.in_use_depth == 0:
+                self.released_at = time.monotonic()
+                if self.close_when_released and not self.closed:
+                    self.close()
+
+    def rollback(self):
+        super().rollback()
+        ActorDBManager.clear_person_cache()
+
+    def close(self):
+        # 带着未结束的事务关闭等同于回滚
+        if not self.closed and self.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            ActorDBManager.clear_person_cache()
+        super().close()
+
+# 每个线程 (gevent 下为每个 greenlet) 缓存一个连接，避免每次查询都重新建立 TCP 连接并认证
+_thread_connections = threading.local()
+
+# 缓存的连接空闲超过该秒数后，复用前先探测一次，避免数据库重启或空闲超时断开后把死连接交给下一个任务
+_CONNECTION_PING_AFTER_IDLE = 60
+
+def _is_reusable(conn: Optional[_ReusableConnection]) -> bool:
+    return (
+        conn is not None
+        and not conn.closed
+        and not conn.close_when_released
+        and conn.in_use_depth == 0
+        and conn.get_transaction_status() == psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    )
+
+def _is_alive(conn: _ReusableConnection) -> bool:
+    """对空闲较久的缓存连接执行一次 SELECT 1；连接已断开时将其关闭并返回 False。"""
+    if time.monotonic() - conn.released_at < _CONNECTION_PING_AFTER_IDLE:
+        return True
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        # 探测只执行了只读查询，直接结束事务，不必清空演员查找缓存
+        psycopg2.extensions.connection.rollback(conn)
+        conn.released_at = time.monotonic()
+        return True
+    except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+        logger.warning(f"缓存的数据库连接已失效，将重新连接: {e}")
+        if not conn.closed:
+            conn.close()
+        return False
+
 def get_db_connection() -> psycopg2.extensions.connection:
     """
     【中央函数】获取一个配置好 RealDictCursor 的 PostgreSQL 数据库连接。
     这是整个应用获取数据库连接的唯一入口。
+    同一线程内复用空闲连接；若缓存的连接正被外层 with 块使用，则另开一个新连接，
+    保证嵌套调用之间的事务互不影响。
     """
+    cached = getattr(_thread_connections, "conn", None)
+    if _is_reusable(cached) and _is_alive(cached):
+        return cached
     try:
         # 从全局配置中获取连接参数
         cfg = config_manager.APP_CONFIG
@@ -41,29 +137,178 @@ def get_db_connection() -> psycopg2.extensions.connection:
             user=cfg.get(constants.CONFIG_OPTION_DB_USER),
             password=cfg.get(constants.CONFIG_OPTION_DB_PASSWORD),
             dbname=cfg.get(constants.CONFIG_OPTION_DB_NAME),
+            options=_SESSION_OPTIONS,
+            connection_factory=_ReusableConnection,
             cursor_factory=RealDictCursor  # ★★★ 关键：让返回的每一行都是字典
         )
-        return conn
     except psycopg2.Error as e:
         logger.error(f"获取 PostgreSQL 数据库连接失败: {e}", exc_info=True)
         raise
+    if cached is None or cached.closed:
+        _thread_connections.conn = conn
+    return conn
+
+def close_thread_connection():
+    """
+    释放当前线程缓存的数据库连接，供后台任务在结束时调用。
+    若该连接仍在某个 with 块中使用，只移出缓存，等最外层 with 块退出后再关闭。
+    """
+    conn = getattr(_thread_connections, "conn", None)
+    _thread_connections.conn = None
+    if conn is None or conn.closed:
+        return
+    if conn.in_use_depth > 0:
+        conn.close_when_released = True
+    else:
+        conn.close()
 
 # ======================================================================
 # 模块 2: 演员数据访问层 (Actor Data Access Layer)
 # ======================================================================
 
+# 查询演员映射时实际用到的列，避免 SELECT * 带出时间戳等无用数据
+PERSON_MAP_COLUMNS = "map_id, primary_name, tmdb_person_id, emby_person_id, imdb_id, douban_celebrity_id"
+# 清理缺少 emby_person_id 的存量脏数据
+_PURGE_DIRTY_PERSON_ROWS_SQL = "DELETE FROM person_identity_map WHERE emby_person_id IS NULL OR emby_person_id = ''"
+# upsert 时可补齐的外部ID列，以及插入前需要检查冲突的全部ID列
+_PERSON_FILL_COLUMNS = ("tmdb_person_id", "imdb_id", "douban_celebrity_id")
+_PERSON_CONFLICT_COLUMNS = ("emby_person_id",) + _PERSON_FILL_COLUMNS
+
+def _norm_text(value: Any) -> Optional[str]:
+    """去除首尾空白，空值统一返回 None；已是 str 时跳过 str() 转换。"""
+    if not value:
+        return None
+    text = (value if isinstance(value, str) else str(value)).strip()
+    return text or None
+
+# --- person_identity_map 动态 SQL 构建 (按列组合缓存，避免每次调用都重新拼接) ---
+@functools.lru_cache(maxsize=64)
+def _build_person_lookup_sql(columns: Tuple[str, ...]) -> str:
+    """按ID列组合生成 UNION ALL 查找语句，match_priority 对应 columns 的顺序。"""
+    return " UNION ALL ".join(
+        f"SELECT {PERSON_MAP_COLUMNS}, {priority} AS match_priority FROM person_identity_map WHERE {column} = %s"
+        for priority, column in enumerate(columns)
+    ) + " ORDER BY match_priority LIMIT 1"
+
+@functools.lru_cache(maxsize=64)
+def _build_person_conflict_sql(columns: Tuple[str, ...]) -> str:
+    """按ID列组合生成插入前的冲突检查语句。"""
+    return " UNION ALL ".join(
+        f"SELECT map_id FROM person_identity_map WHERE {column} = %s" for column in columns
+    ) + " LIMIT 1"
+
+@functools.lru_cache(maxsize=64)
+def _build_person_exists_sql(columns: Tuple[str, ...]) -> str:
+    """按ID列组合生成补齐前的冲突探测语句：每列一个 EXISTS，结果列名即ID列名。"""
+    return "SELECT " + ", ".join(
+        f"EXISTS (SELECT 1 FROM person_identity_map WHERE {column} = %s AND emby_person_id <> %s) AS {column}"
+        for column in columns
+    )
+
+@functools.lru_cache(maxsize=64)
+def _build_person_update_sql(columns: Tuple[str, ...]) -> str:
+    set_clauses = [f"{column} = %s" for column in columns]
+    set_clauses.append("last_updated_at = NOW()")
+    return f"UPDATE person_identity_map SET {', '.join(set_clauses)} WHERE map_id = %s"
+
+@functools.lru_cache(maxsize=64)
+def _build_person_insert_sql(columns: Tuple[str, ...]) -> str:
+    return f"""
+        INSERT INTO person_identity_map ({', '.join(columns)}, last_updated_at) 
+        VALUES ({', '.join(['%s'] * len(columns))}, NOW())
+        RETURNING map_id
+    """
+
+# 常见情况（无跨记录ID冲突）下的单语句 UPSERT：以 emby_person_id 为冲突键，
+# 已有的外部ID保持不变，只补齐缺失的ID；名字仅在传入非空时覆盖。
+# 数据与库中一致时 WHERE 条件不成立，不产生任何写入（也不刷新 last_updated_at），RETURNING 为空，
+# 此时由 UNION ALL 的第二个分支读出已有记录。因此无论插入、补齐还是无变化，一条语句都能拿到 map_id；
+# changed 表示本次是否真正写入。
+_PERSON_UPSERT_SQL = """
+    WITH upserted AS (
+    INSERT INTO person_identity_map (primary_name, emby_person_id, tmdb_person_id, imdb_id, douban_celebrity_id, last_updated_at)
+    VALUES (%(primary_name)s, %(emby_person_id)s, %(tmdb_person_id)s, %(imdb_id)s, %(douban_celebrity_id)s, NOW())
+    ON CONFLICT (emby_person_id) DO UPDATE SET
+        primary_name = COALESCE(NULLIF(EXCLUDED.primary_name, ''), person_identity_map.primary_name),
+        tmdb_person_id = COALESCE(person_identity_map.tmdb_person_id, EXCLUDED.tmdb_person_id),
+        imdb_id = COALESCE(NULLIF(person_identity_map.imdb_id, ''), EXCLUDED.imdb_id),
+        douban_celebrity_id = COALESCE(NULLIF(person_identity_map.douban_celebrity_id, ''), EXCLUDED.douban_celebrity_id),
+        last_updated_at = NOW()
+    WHERE (NULLIF(EXCLUDED.primary_name, '') IS NOT NULL AND EXCLUDED.primary_name IS DISTINCT FROM person_identity_map.primary_name)
+       OR (person_identity_map.tmdb_person_id IS NULL AND EXCLUDED.tmdb_person_id IS NOT NULL)
+       OR (NULLIF(person_identity_map.imdb_id, '') IS NULL AND EXCLUDED.imdb_id IS NOT NULL)
+       OR (NULLIF(person_identity_map.douban_celebrity_id, '') IS NULL AND EXCLUDED.douban_celebrity_id IS NOT NULL)
+    RETURNING map_id, primary_name, tmdb_person_id, emby_person_id, imdb_id, douban_celebrity_id, TRUE AS changed
+    )
+    SELECT * FROM upserted
+    UNION ALL
+    SELECT map_id, primary_name, tmdb_person_id, emby_person_id, imdb_id, douban_celebrity_id, FALSE AS changed
+    FROM person_identity_map
+    WHERE emby_person_id = %(emby_person_id)s AND NOT EXISTS (SELECT 1 FROM upserted)
+"""
+
 class ActorDBManager:
     """
     一个专门负责与演员身份相关的数据库表进行交互的类。
     """
+    # 并发写入（Webhook、定时任务等线程可能同时写入演员映射表）不在进程内加锁：
+    # 同一行的并发修改由 PostgreSQL 行锁串行化，ID 冲突由 UNIQUE 约束 + ON CONFLICT/保存点处理。
+    # 进程级演员查找缓存：同一个演员会在大量影片/分集中反复出现，用 LRU 缓存记住 (ID列, ID值) -> 映射记录。
+    # 所有实例共享，任何绕过 upsert_person 修改映射表的写入方都可以通过 clear_person_cache() 使其失效。
+    _lookup_cache = LRUCache(maxsize=4096)
+    _lookup_cache_lock = threading.RLock()
+
+    # person_identity_map 中可用于定位演员的所有ID列
+    PERSON_ID_COLUMNS = ("tmdb_person_id", "emby_person_id", "imdb_id", "douban_celebrity_id")
+    # 调用方传入的演员数据中的外部ID字段（emby_id 作为分组键除外）
+    PERSON_ID_INPUT_FIELDS = ("tmdb_id", "imdb_id", "douban_id")
+
     def __init__(self):
         # PostgreSQL 连接信息从全局配置读取
+        # 翻译缓存的内存副本：同一原文（演员名/角色名）在同一部剧的各分集间反复出现，命中时免去一次数据库往返
+        self._translation_cache = LRUCache(maxsize=10000)
+        self._translation_cache_lock = threading.Lock()
         logger.trace("ActorDBManager 初始化 (PostgreSQL mode)。")
 
+    def _remember_translations(self, rows: List[Dict[str, Any]]):
+        """将已确认有效的翻译缓存行 (original_text/translated_text/engine_used) 写入内存副本。"""
+        with self._translation_cache_lock:
+            for row in rows:
+                self._translation_cache[row['original_text']] = dict(row)
+
+    @classmethod
+    def clear_person_cache(cls):
+        """清空演员查找缓存。批量修改/删除映射记录、事务回滚以及每个后台任务开始时调用。"""
+        with cls._lookup_cache_lock:
+            cls._lookup_cache.clear()
+
+    def _cache_person_record(self, record: Dict[str, Any]):
+        """将一条映射记录按它拥有的每个ID写入查找缓存。"""
+        with self._lookup_cache_lock:
+            for column in self.PERSON_ID_COLUMNS:
+                if record.get(column):
+                    self._lookup_cache[(column, str(record[column]))] = dict(record)
+
+    def _invalidate_person_cache(self, *records: Optional[Dict[str, Any]]):
+        """写入后调用，移除与这些记录任一ID相关的缓存项。"""
+        with self._lookup_cache_lock:
+            for record in records:
+                if not record:
+                    continue
+                for column in self.PERSON_ID_COLUMNS:
+                    if record.get(column):
+                        self._lookup_cache.pop((column, str(record[column])), None)
+
     def get_translation_from_db(self, cursor: psycopg2.extensions.cursor, text: str, by_translated_text: bool = False) -> Optional[Dict[str, Any]]:
         """
         【PostgreSQL版】从数据库获取翻译缓存，并自我净化坏数据。
         """
+        if not by_translated_text:
+            with self._translation_cache_lock:
+                cached = self._translation_cache.get(text)
+            if cached is not None:
+                return dict(cached)
+
         try:
             if by_translated_text:
                 sql = "SELECT original_text, translated_text, engine_used FROM translation_cache WHERE translated_text = %s"
@@ -87,12 +332,57 @@ class ActorDBManager:
                     logger.error(f"销毁无效缓存 '{original_text_key}' 时失败: {e_delete}")
                 return None
             
+            self._remember_translations([row])
             return dict(row)
 
         except Exception as e:
             logger.error(f"DB读取翻译缓存时发生错误 for '{text}': {e}", exc_info=True)
             return None
 
+    def get_translations_from_db(self, cursor: psycopg2.extensions.cursor, texts: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        【批量版】一次查询取回多个原文的翻译缓存，返回 {原文: 缓存行}。
+        与 get_translation_from_db 一样会销毁不含中文的无效缓存。
+        """
+        if not texts:
+            return {}
+        results, texts_to_query = {}, []
+        with self._translation_cache_lock:
+            for text in texts:
+                cached = self._translation_cache.get(text)
+                if cached is not None:
+                    results[text] = dict(cached)
+                else:
+                    texts_to_query.append(text)
+        if not texts_to_query:
+            return results
+        try:
+            cursor.execute(
+                "SELECT original_text, translated_text, engine_used FROM translation_cache WHERE original_text = ANY(%s)",
+                (texts_to_query,)
+            )
+            invalid_keys, fetched_rows = [], []
+            for row in cursor.fetchall():
+                translated_text = row['translated_text']
+                if translated_text and not contains_chinese(translated_text):
+                    logger.warning(f"发现无效的历史翻译缓存: '{row['original_text']}' -> '{translated_text}'。将自动销毁此记录。")
+                    invalid_keys.append(row['original_text'])
+                else:
+                    results[row['original_text']] = dict(row)
+                    fetched_rows.append(row)
+            self._remember_translations(fetched_rows)
+
+            if invalid_keys:
+                try:
+                    cursor.execute("DELETE FROM translation_cache WHERE original_text = ANY(%s)", (invalid_keys,))
+                except Exception as e_delete:
+                    logger.error(f"销毁 {len(invalid_keys)} 条无效缓存时失败: {e_delete}")
+            return results
+
+        except Exception as e:
+            logger.error(f"DB批量读取翻译缓存时发生错误 ({len(texts_to_query)} 个词条): {e}", exc_info=True)
+            return results
+
     def save_translation_to_db(self, cursor: psycopg2.extensions.cursor, original_text: str, translated_text: Optional[str], engine_used: Optional[str]):
         """
         【PostgreSQL版】将翻译结果保存到数据库，增加中文校验。
@@ -112,71 +402,153 @@ class ActorDBManager:
                     last_updated_at = NOW();
             """
             cursor.execute(sql, (original_text, translated_text, engine_used))
-            logger.trace(f"翻译缓存存DB: '{original_text}' -> '{translated_text}' (引擎: {engine_used})")
+            self._remember_translations([{'original_text': original_text, 'translated_text': translated_text, 'engine_used': engine_used}])
+            logger.trace("翻译缓存存DB: '%s' -> '%s' (引擎: %s)", original_text, translated_text, engine_used)
         except Exception as e:
             logger.error(f"DB保存翻译缓存失败 for '{original_text}': {e}", exc_info=True)
 
-    def find_person_by_any_id(self, cursor: psycopg2.extensions.cursor, **kwargs) -> Optional[dict]:
-        search_criteria = [
+    def save_translations_to_db(self, cursor: psycopg2.extensions.cursor, translations: Dict[str, Optional[str]], engine_used: Optional[str]):
+        """
+        【批量版】将 {原文: 译文} 一次性写入翻译缓存，校验规则与 save_translation_to_db 相同。
+        """
+        rows = []
+        for original_text, translated_text in translations.items():
+            if translated_text and translated_text.strip() and not contains_chinese(translated_text):
+                logger.warning(f"翻译结果 '{translated_text}' 不含中文，已丢弃。原文: '{original_text}'")
+                continue
+            rows.append((original_text, translated_text, engine_used))
+        if not rows:
+            return
+
+        try:
+            sql = """
+                INSERT INTO translation_cache (original_text, translated_text, engine_used, last_updated_at) 
+                VALUES %s
+                ON CONFLICT (original_text) DO UPDATE SET
+                    translated_text = EXCLUDED.translated_text,
+                    engine_used = EXCLUDED.engine_used,
+                    last_updated_at = NOW();
+            """
+            execute_values(cursor, sql, rows, template="(%s, %s, %s, NOW())")
+            self._remember_translations([
+                {'original_text': o, 'translated_text': t, 'engine_used': e} for o, t, e in rows
+            ])
+            logger.trace("翻译缓存批量存DB: %s 条 (引擎: %s)", len(rows), engine_used)
+        except Exception as e:
+            logger.error(f"DB批量保存翻译缓存失败 ({len(rows)} 条): {e}", exc_info=True)
+
+    def find_person_by_any_id(self, cursor: psycopg2.extensions.cursor, **kwargs: Any) -> Optional[Dict[str, Any]]:
+        search_criteria: List[Tuple[str, Any]] = [
             ("tmdb_person_id", kwargs.get("tmdb_id")),
             ("emby_person_id", kwargs.get("emby_id")),
             ("imdb_id", kwargs.get("imdb_id")),
             ("douban_celebrity_id", kwargs.get("douban_id")),
         ]
-        for column, value in search_criteria:
-            if not value: continue
-            try:
-                cursor.execute(f"SELECT * FROM person_identity_map WHERE {column} = %s", (value,))
-                result = cursor.fetchone()
-                if result:
-                    logger.debug(f"通过 {column}='{value}' 找到了演员记录 (map_id: {result['map_id']})。")
-                    return result
-            except psycopg2.Error as e:
-                logger.error(f"查询 person_identity_map 时出错 ({column}={value}): {e}")
-        return None
+        provided: List[Tuple[str, Any]] = [(column, value) for column, value in search_criteria if value]
+        if not provided:
+            return None
 
-    def upsert_person(self, cursor: psycopg2.extensions.cursor, person_data: Dict[str, Any], **kwargs) -> int:
+        # 只用优先级最高的那个ID查缓存：若它未命中，低优先级ID的缓存记录可能不是数据库按优先级会返回的那条
+        column, value = provided[0]
+        with self._lookup_cache_lock:
+            cached = self._lookup_cache.get((column, str(value)))
+        if cached:
+            logger.trace("通过 %s='%s' 命中演员查找缓存 (map_id: %s)。", column, value, cached['map_id'])
+            return dict(cached)
+
+        # 所有ID条件合并为一条 UNION ALL 查询，每个分支都能单独走对应列的唯一索引，
+        # 并用 match_priority 保持原先 tmdb -> emby -> imdb -> douban 的查找优先级。
+        sql = _build_person_lookup_sql(tuple(column for column, _ in provided))
+        try:
+            cursor.execute(sql, tuple(value for _, value in provided))
+            result = cursor.fetchone()
+        except psycopg2.Error as e:
+            logger.error(f"查询 person_identity_map 时出错 ({provided}): {e}")
+            return None
+
+        if not result:
+            return None
+        record: Dict[str, Any] = dict(result)
+        column, value = provided[record.pop("match_priority")]
+        logger.debug("通过 %s='%s' 找到了演员记录 (map_id: %s)。", column, value, record['map_id'])
+        self._cache_person_record(record)
+        return record
+
+    @staticmethod
+    def _normalize_person_data(person_data: Dict[str, Any]) -> Dict[str, Any]:
+        """将调用方传入的演员数据转换为 person_identity_map 的列格式。"""
+        get = person_data.get
+        tmdb_id = get("tmdb_id")
+        return {
+            "primary_name": _norm_text(get("name")) or '',
+            "emby_person_id": _norm_text(get("emby_id")),
+            "tmdb_person_id": int(tmdb_id) if tmdb_id else None,
+            "imdb_id": _norm_text(get("imdb_id")),
+            "douban_celebrity_id": _norm_text(get("douban_id")),
+        }
+
+    def upsert_person(self, cursor: psycopg2.extensions.cursor, person_data: Dict[str, Any], *, purge_dirty_rows: bool = True, **kwargs: Any) -> int:
         """
         以 emby_person_id 为主，补齐缺失的外部ID，冲突则跳过。
-        额外清理存量数据中缺少 emby_person_id 的脏数据。
+        额外清理存量数据中缺少 emby_person_id 的脏数据（批量调用方已统一清理时可传 purge_dirty_rows=False）。
         """
         try:
             # 1. 清理存量脏数据
-            cursor.execute("DELETE FROM person_identity_map WHERE emby_person_id IS NULL OR emby_person_id = ''")
-
-            # 2. 标准化输入数据
-            new_data = {
-                "primary_name": str(person_data.get("name") or '').strip(),
-                "emby_person_id": str(person_data.get("emby_id") or '').strip() or None,
-                "tmdb_person_id": int(person_data.get("tmdb_id")) if person_data.get("tmdb_id") else None,
-                "imdb_id": str(person_data.get("imdb_id") or '').strip() or None,
-                "douban_celebrity_id": str(person_data.get("douban_id") or '').strip() or None,
-            }
+            if purge_dirty_rows:
+                cursor.execute(_PURGE_DIRTY_PERSON_ROWS_SQL)
+                if cursor.rowcount:
+                    self.clear_person_cache()
+
+            # 2. 标准化输入数据（如非数字的 TMDb ID）失败时只跳过这一位演员，不影响同批次的其他人
+            try:
+                new_data = self._normalize_person_data(person_data)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"演员数据格式无效，跳过 emby_person_id={person_data.get('emby_id')}: {e}")
+                return -1
 
             # 必须有 emby_person_id
             if new_data["emby_person_id"] is None:
                 logger.warning("缺失 emby_person_id，无法执行 upsert")
                 return -1
 
-            id_fields = ["tmdb_person_id", "imdb_id", "douban_celebrity_id"]
             cursor.execute("SAVEPOINT actor_upsert")
 
-            # 3. 查找已有记录
-            cursor.execute("SELECT * FROM person_identity_map WHERE emby_person_id = %s", (new_data["emby_person_id"],))
+            # 3. 快速路径：一条语句完成插入/补齐并取回 map_id；若补齐的ID与其他记录冲突，
+            #    数据库会抛出唯一约束错误，此时回滚到保存点（保存点仍然有效），改走下面的逐字段处理路径。
+            try:
+                cursor.execute(_PERSON_UPSERT_SQL, new_data)
+                upserted = cursor.fetchone()
+                if upserted["changed"]:
+                    self._invalidate_person_cache(upserted, new_data)
+                cursor.execute("RELEASE SAVEPOINT actor_upsert")
+                return upserted["map_id"]
+            except psycopg2.IntegrityError:
+                cursor.execute("ROLLBACK TO SAVEPOINT actor_upsert")
+                logger.trace("  -> emby_person_id='%s' 存在外部ID冲突，改用逐字段补齐。", new_data['emby_person_id'])
+
+            # 4. 查找已有记录
+            cursor.execute(f"SELECT {PERSON_MAP_COLUMNS} FROM person_identity_map WHERE emby_person_id = %s", (new_data["emby_person_id"],))
             existing_record = cursor.fetchone()
             if existing_record:
-                existing_record = dict(existing_record)
+                # RealDictCursor 返回的行本身就是 dict，无需再复制
                 # 补齐缺失字段
                 update_fields = {}
-                for f in id_fields:
-                    new_val = new_data.get(f)
-                    if new_val is not None and not existing_record.get(f):
-                        cursor.execute(f"SELECT map_id FROM person_identity_map WHERE {f} = %s AND emby_person_id <> %s", (new_val, new_data["emby_person_id"]))
-                        conflict = cursor.fetchone()
-                        if conflict:
-                            logger.warning(f"  -> 字段 {f}='{new_val}' 冲突于其他记录，跳过更新")
+                fill_fields = tuple(
+                    f for f in _PERSON_FILL_COLUMNS
+                    if new_data.get(f) is not None and not existing_record.get(f)
+                )
+                if fill_fields:
+                    # 一次查询完成所有待补齐字段的冲突检查，每个 EXISTS 都是一次唯一索引探测
+                    cursor.execute(
+                        _build_person_exists_sql(fill_fields),
+                        tuple(v for f in fill_fields for v in (new_data[f], new_data["emby_person_id"]))
+                    )
+                    conflicts = cursor.fetchone()
+                    for f in fill_fields:
+                        if conflicts[f]:
+                            logger.warning(f"  -> 字段 {f}='{new_data[f]}' 冲突于其他记录，跳过更新")
                         else:
-                            update_fields[f] = new_val
+                            update_fields[f] = new_data[f]
 
                 new_name = new_data["primary_name"]
                 old_name = existing_record.get("primary_name") or ""
@@ -184,42 +556,33 @@ class ActorDBManager:
                     update_fields["primary_name"] = new_name
 
                 if update_fields:
-                    set_clauses = [f"{k} = %s" for k in update_fields.keys()]
-                    set_clauses.append("last_updated_at = NOW()")
-                    sql = f"UPDATE person_identity_map SET {', '.join(set_clauses)} WHERE map_id = %s"
+                    sql = _build_person_update_sql(tuple(update_fields.keys()))
                     cursor.execute(sql, tuple(update_fields.values()) + (existing_record["map_id"],))
+                    self._invalidate_person_cache(existing_record, new_data)
 
                 cursor.execute("RELEASE SAVEPOINT actor_upsert")
                 return existing_record["map_id"]
 
-            # 4. 记录不存在，尝试插入
-            conflict_conditions = []
-            conflict_values = []
-            for f in ["emby_person_id"] + id_fields:
-                v = new_data.get(f)
-                if v:
-                    conflict_conditions.append(f"{f} = %s")
-                    conflict_values.append(v)
-            if conflict_conditions:
-                cond_str = " OR ".join(conflict_conditions)
-                cursor.execute(f"SELECT map_id FROM person_identity_map WHERE {cond_str}", tuple(conflict_values))
+            # 5. 记录不存在，尝试插入
+            # 一次遍历得到 (列名, 值) 对，SQL 与参数都从这里取，不再反复构造列表
+            provided = [(f, v) for f in _PERSON_CONFLICT_COLUMNS if (v := new_data[f])]
+            if provided:
+                conflict_columns, conflict_values = zip(*provided)
+                # 跨列 OR 条件无法稳定利用单列索引，改为 UNION ALL，每个分支都是一次索引查找
+                cond_sql = _build_person_conflict_sql(conflict_columns)
+                cursor.execute(cond_sql, conflict_values)
                 conflict_rec = cursor.fetchone()
                 if conflict_rec:
                     logger.warning(f"新记录 emby_person_id='{new_data['emby_person_id']}' 存在外部ID冲突，跳过插入")
                     cursor.execute("RELEASE SAVEPOINT actor_upsert")
                     return -1
 
-            insert_fields = [k for k, v in new_data.items() if v is not None]
-            insert_placeholders = ["%s"] * len(insert_fields)
-            insert_values = [new_data[k] for k in insert_fields]
+            insert_fields, insert_values = zip(*[(k, v) for k, v in new_data.items() if v is not None])
 
-            sql_insert = f"""
-                INSERT INTO person_identity_map ({', '.join(insert_fields)}, last_updated_at) 
-                VALUES ({', '.join(insert_placeholders)}, NOW())
-                RETURNING map_id
-            """
-            cursor.execute(sql_insert, tuple(insert_values))
+            sql_insert = _build_person_insert_sql(insert_fields)
+            cursor.execute(sql_insert, insert_values)
             result = cursor.fetchone()
+            self._invalidate_person_cache(new_data)
             cursor.execute("RELEASE SAVEPOINT actor_upsert")
             return result["map_id"] if result else -1
 
@@ -227,7 +590,196 @@ class ActorDBManager:
             cursor.execute("ROLLBACK TO SAVEPOINT actor_upsert")
             logger.error(f"upsert_person 异常，emby_person_id={person_data.get('emby_id')}: {e}", exc_info=True)
             return -1
-        
+
+    def upsert_person_batch(self, conn: psycopg2.extensions.connection, people: List[Dict[str, Any]], **kwargs) -> List[int]:
+        """
+        在同一个事务中批量写入一组演员（通常是一部影片/一集的完整演员表），只提交一次。
+        返回与输入顺序一致的 map_id 列表，-1 表示该条被跳过或写入失败。
+        """
+        if not people:
+            return []
+        unique_people, positions = self._dedupe_by_identity(people)
+        try:
+            # 批量预探测/插入只做位置访问，用普通元组游标避免为每行构造 RealDictRow
+            with conn.cursor(cursor_factory=psycopg2.extensions.cursor) as tuple_cursor:
+                # 0. 脏数据清理整批只做一次，而不是每位演员执行一次
+                tuple_cursor.execute(_PURGE_DIRTY_PERSON_ROWS_SQL)
+                if tuple_cursor.rowcount:
+                    self.clear_person_cache()
+                # 1. 全新演员（所有ID在库中和本批次中都未出现）一次性批量插入
+                resolved_map_ids = self._bulk_insert_new_people(tuple_cursor, unique_people)
+                # 2. 已在库中且本次没有任何新信息的演员（全量同步时的绝大多数）一次查询直接取回 map_id
+                resolved_map_ids.update(self._lookup_unchanged_people(tuple_cursor, unique_people, resolved_map_ids))
+            with conn.cursor() as cursor:
+                # 3. 其余演员（需要补齐/改名或有ID冲突）走常规的补齐/合并逻辑
+                unique_map_ids = [
+                    resolved_map_ids[i] if i in resolved_map_ids else self.upsert_person(cursor, person_data, purge_dirty_rows=False, **kwargs)
+                    for i, person_data in enumerate(unique_people)
+                ]
+            conn.commit()
+            return [unique_map_ids[pos] for pos in positions]
+        except Exception as e:
+            # 任何异常都要回滚，避免已写入的部分数据留在未结束的事务中
+            conn.rollback()
+            logger.error(f"批量写入 {len(people)} 位演员时失败，已回滚: {e}", exc_info=True)
+            raise
+
+    @staticmethod
+    def _dedupe_by_identity(people: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """
+        按 emby_id 对同一批次中的演员分组合并（同一个人可能从多个来源重复出现），
+        合并结果与逐条依次写入时一致：名字取最后一个非空值（后写入的非空名字会覆盖），
+        外部ID取第一个非空值（upsert 只补齐缺失的ID，不覆盖已有ID）。
+        返回 (去重后的列表, 每个输入在去重列表中的下标)。
+        没有 emby_id 的条目原样保留，交给 upsert_person 处理。
+        """
+        unique_people, positions, index_by_key = [], [], {}
+        # 每个分组还缺哪些外部ID；补齐后只需再看名字，不必逐字段比较
+        missing_by_index: Dict[int, set] = {}
+        for person_data in people:
+            key = str(person_data.get("emby_id") or '').strip()
+            if key and key in index_by_key:
+                index = index_by_key[key]
+                merged = unique_people[index]
+                if _norm_text(person_data.get("name")):
+                    merged["name"] = person_data["name"]
+                missing = missing_by_index[index]
+                if missing:
+                    for field in list(missing):
+                        value = person_data.get(field)
+                        if value:
+                            merged[field] = value
+                            missing.discard(field)
+                positions.append(index)
+                continue
+            merged = dict(person_data)
+            if key:
+                index_by_key[key] = len(unique_people)
+                missing_by_index[len(unique_people)] = {f for f in ActorDBManager.PERSON_ID_INPUT_FIELDS if not merged.get(f)}
+            positions.append(len(unique_people))
+            unique_people.append(merged)
+        return unique_people, positions
+
+    def _lookup_unchanged_people(self, cursor: psycopg2.extensions.cursor, people: List[Dict[str, Any]], skip_indexes: Dict[int, int]) -> Dict[int, int]:
+        """
+        用一条 = ANY 查询读出本批次中已存在的演员；名字未变且没有可补齐字段的，直接返回其 map_id，
+        省去逐条 UPSERT 及其保存点往返。返回 {people中的下标: map_id}。
+        cursor 须为返回元组的普通游标。
+        """
+        normalized_by_index = {}
+        for i, person_data in enumerate(people):
+            if i in skip_indexes:
+                continue
+            try:
+                new_data = self._normalize_person_data(person_data)
+            except (TypeError, ValueError):
+                continue  # 格式无效，由 upsert_person 记录并返回 -1
+            if new_data["emby_person_id"] is not None:
+                normalized_by_index[i] = new_data
+        if not normalized_by_index:
+            return {}
+
+        cursor.execute(
+            f"SELECT map_id, emby_person_id, primary_name, {', '.join(_PERSON_FILL_COLUMNS)} "
+            "FROM person_identity_map WHERE emby_person_id = ANY(%s)",
+            ([new_data["emby_person_id"] for new_data in normalized_by_index.values()],)
+        )
+        existing_by_emby_id = {row[1]: row for row in cursor}
+
+        unchanged = {}
+        for i, new_data in normalized_by_index.items():
+            row = existing_by_emby_id.get(new_data["emby_person_id"])
+            if row is None:
+                continue
+            map_id, _, old_name, *old_ids = row
+            # 判定条件与 _PERSON_UPSERT_SQL 的 WHERE 子句一致：改名或补齐任一空缺ID都要走写入路径
+            new_name = new_data["primary_name"]
+            if new_name and new_name != old_name:
+                continue
+            if any(new_data[f] is not None and old in (None, '') for f, old in zip(_PERSON_FILL_COLUMNS, old_ids)):
+                continue
+            unchanged[i] = map_id
+        if unchanged:
+            logger.trace("批次中 %d 位演员在库中已是最新，跳过写入。", len(unchanged))
+        return unchanged
+
+    def _bulk_insert_new_people(self, cursor: psycopg2.extensions.cursor, people: List[Dict[str, Any]]) -> Dict[int, int]:
+        """
+        先用一次查询预探测本批次所有ID在库中是否已存在，再把完全没有冲突的新演员用一条
+        INSERT 批量写入。返回 {people中的下标: map_id}；未包含的下标需要走 upsert_person。
+        cursor 须为返回元组的普通游标。
+        """
+        normalized = []
+        for person_data in people:
+            try:
+                normalized.append(self._normalize_person_data(person_data))
+            except (TypeError, ValueError):
+                normalized.append(None)  # 格式无效，由 upsert_person 记录并返回 -1
+
+        values_by_column = {column: [] for column in self.PERSON_ID_COLUMNS}
+        for new_data in normalized:
+            if not new_data:
+                continue
+            for column in self.PERSON_ID_COLUMNS:
+                if new_data[column] is not None:
+                    values_by_column[column].append(new_data[column])
+        probe_columns = [column for column in self.PERSON_ID_COLUMNS if values_by_column[column]]
+        if not probe_columns:
+            return {}
+
+        # 每列一个 = ANY(...) 分支，各自走唯一索引
+        probe_sql = " UNION ALL ".join(
+            f"SELECT {', '.join(self.PERSON_ID_COLUMNS)} FROM person_identity_map WHERE {column} = ANY(%s)"
+            for column in probe_columns
+        )
+        cursor.execute(probe_sql, tuple(values_by_column[column] for column in probe_columns))
+        probe_rows = cursor.fetchall()
+        # 按列直接构建已占用ID集合 (zip 转置为每列一个元组)，不逐行展开为中间结构
+        probe_columns_values = list(zip(*probe_rows)) or [()] * len(self.PERSON_ID_COLUMNS)
+        taken = {
+            column: set(values) - {None}
+            for column, values in zip(self.PERSON_ID_COLUMNS, probe_columns_values)
+        }
+
+        new_indexes, rows = [], []
+        for i, new_data in enumerate(normalized):
+            if not new_data or new_data["emby_person_id"] is None:
+                continue
+            if any(new_data[column] is not None and new_data[column] in taken[column] for column in self.PERSON_ID_COLUMNS):
+                continue
+            for column in self.PERSON_ID_COLUMNS:
+                if new_data[column] is not None:
+                    taken[column].add(new_data[column])
+            new_indexes.append(i)
+            rows.append((new_data["primary_name"], new_data["emby_person_id"], new_data["tmdb_person_id"],
+                         new_data["imdb_id"], new_data["douban_celebrity_id"]))
+        if not rows:
+            return {}
+
+        cursor.execute("SAVEPOINT actor_bulk_insert")
+        try:
+            inserted = execute_values(
+                cursor,
+                """
+                    INSERT INTO person_identity_map (primary_name, emby_person_id, tmdb_person_id, imdb_id, douban_celebrity_id, last_updated_at)
+                    VALUES %s
+                    RETURNING emby_person_id, map_id
+                """,
+                rows,
+                template="(%s, %s, %s, %s, %s, NOW())",
+                fetch=True
+            )
+            cursor.execute("RELEASE SAVEPOINT actor_bulk_insert")
+        except psycopg2.IntegrityError as e:
+            # 预探测之后被其他连接写入了冲突数据，全部退回逐条处理
+            cursor.execute("ROLLBACK TO SAVEPOINT actor_bulk_insert")
+            logger.warning(f"批量插入新演员时发生ID冲突，改为逐条写入: {e}")
+            return {}
+
+        map_id_by_emby_id = dict(inserted)  # RETURNING emby_person_id, map_id
+        logger.trace("批量插入了 %d 位新演员。", len(map_id_by_emby_id))
+        return {i: map_id_by_emby_id[normalized[i]["emby_person_id"]] for i in new_indexes}
+
 # ======================================================================
 # 模块 3: 日志表数据访问 (Log Tables Data Access)
 # ======================================================================
@@ -265,25 +817,22 @@ def get_review_items_paginated(page: int, per_page: int, query_filter: str) -> T
 def mark_review_item_as_processed(item_id: str) -> bool:
     try:
         with get_db_connection() as conn:
-            cursor = conn.cursor()
             with conn.cursor() as cursor:
-                cursor.execute("SELECT item_name, item_type, score FROM failed_log WHERE item_id = %s", (item_id,))
-                failed_item_info = cursor.fetchone()
-                if not failed_item_info: return False
-
-                cursor.execute("DELETE FROM failed_log WHERE item_id = %s", (item_id,))
-                
-                score_to_save = failed_item_info["score"] if failed_item_info["score"] is not None else 10.0
-                
-                upsert_sql = """
-                    INSERT INTO processed_log (item_id, item_name, processed_at, score) 
-                    VALUES (%s, %s, NOW(), %s)
+                # 与 clear_all_review_items 相同：一条 SQL 完成"从待复核删除 + 写入已处理"，只需一次往返
+                sql = """
+                    WITH moved_row AS (
+                        DELETE FROM failed_log WHERE item_id = %s RETURNING item_id, item_name, score
+                    )
+                    INSERT INTO processed_log (item_id, item_name, processed_at, score)
+                    SELECT item_id, item_name, NOW(), COALESCE(score, 10.0) FROM moved_row
                     ON CONFLICT (item_id) DO UPDATE SET
                         item_name = EXCLUDED.item_name,
                         processed_at = NOW(),
                         score = EXCLUDED.score;
                 """
-                cursor.execute(upsert_sql, (item_id, failed_item_info["item_name"], score_to_save))
+                cursor.execute(sql, (item_id,))
+                if cursor.rowcount == 0:
+                    return False
             conn.commit()
             logger.info(f"DB: 项目 {item_id} 已成功移至已处理日志。")
             return True
@@ -439,11 +988,11 @@ def batch_force_end_watchlist_items(item_ids: List[str]) -> int:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
-            placeholders = ','.join('%s' for _ in item_ids)
             # 将状态更新为 Ended，并设置 force_ended 标志
-            sql = f"UPDATE watchlist SET status = 'Completed', force_ended = TRUE WHERE item_id IN ({placeholders})"
+            # ID 列表作为单个数组参数传入，SQL 文本固定，不随列表长度变化
+            sql = "UPDATE watchlist SET status = 'Completed', force_ended = TRUE WHERE item_id = ANY(%s)"
             
-            cursor.execute(sql, item_ids)
+            cursor.execute(sql, (list(item_ids),))
             conn.commit()
             
             updated_count = cursor.rowcount
@@ -482,10 +1031,9 @@ def batch_update_watchlist_status(item_ids: list, new_status: str) -> int:
             
             values = list(updates.values())
             
-            placeholders = ', '.join(['%s'] * len(item_ids))
-            sql = f"UPDATE watchlist SET {', '.join(set_clauses)} WHERE item_id IN ({placeholders})"
+            sql = f"UPDATE watchlist SET {', '.join(set_clauses)} WHERE item_id = ANY(%s)"
             
-            values.extend(item_ids)
+            values.append(list(item_ids))
             
             cursor.execute(sql, tuple(values))
             conn.commit()
@@ -672,9 +1220,8 @@ def batch_mark_movies_as_subscribed_in_collections(collection_ids: List[str]) ->
         with get_db_connection() as conn:
             cursor = conn.cursor()
             
-            placeholders = ','.join('%s' for _ in collection_ids)
-            sql_select = f"SELECT emby_collection_id, missing_movies_json FROM collections_info WHERE emby_collection_id IN ({placeholders})"
-            cursor.execute(sql_select, collection_ids)
+            sql_select = "SELECT emby_collection_id, missing_movies_json FROM collections_info WHERE emby_collection_id = ANY(%s)"
+            cursor.execute(sql_select, (list(collection_ids),))
             collections_to_process = cursor.fetchall()
 
             if not collections_to_process:
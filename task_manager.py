@@ -10,6 +10,7 @@ from core_processor import MediaProcessor
 from watchlist_processor import WatchlistProcessor
 from actor_subscription_processor import ActorSubscriptionProcessor
 import extensions
+import db_handler
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,8 @@ def _execute_task_with_lock(task_function: Callable, task_name: str, processor:
             return
 
         processor.clear_stop_signal()
+        # 任务之间可能有其他写入方修改过演员映射表，每个任务都从空的查找缓存开始
+        db_handler.ActorDBManager.clear_person_cache()
 
         background_task_status.update({
             "is_running": True, "current_action": task_name, "last_action": task_name,
@@ -88,6 +91,8 @@ def _execute_task_with_lock(task_function: Callable, task_name: str, processor:
                 "is_running": False, "current_action": "无", "progress": 0, "message": "等待任务"
             })
             processor.clear_stop_signal()
+            # 数据库连接按线程缓存，必须在执行任务的工人线程上释放
+            db_handler.close_thread_connection()
             logger.trace(f"后台任务 '{task_name}' 状态已重置。")
 
 def task_worker_function():
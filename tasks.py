@@ -524,6 +524,8 @@ def task_import_database(processor, file_content: str, tables_to_import: List[st
                 for line in summary_lines: logger.info(line)
                 logger.info("="*36)
                 conn.commit()
+                # 演员映射表可能已被整表覆盖，内存中的演员查找缓存随之失效
+                db_handler.ActorDBManager.clear_person_cache()
                 logger.info("✅ 数据库事务已成功提交！所有选择的表已恢复。")
     except Exception as e:
         logger.error(f"数据库恢复任务发生严重错误，所有更改将回滚: {e}", exc_info=True)
@@ -1,6 +1,8 @@
 # tmdb_handler.py
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 import concurrent.futures
@@ -16,6 +18,16 @@ TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
 DEFAULT_LANGUAGE = "zh-CN"
 DEFAULT_REGION = "CN"
 
+# 所有 TMDb API 请求共用一个 Session：复用 keep-alive 连接和 TLS 会话，
+# 并发补充演员信息时不必为每个请求重新握手。连接池大小覆盖各处线程池的并发数。
+# 多个线程池同时请求时可能触发 TMDb 限流 (429)：按 Retry-After 退避重试，而不是直接返回 None 丢掉这位演员。
+_tmdb_retry = Retry(
+    total=3, status_forcelist=(429,), allowed_methods=("GET",),
+    backoff_factor=1, respect_retry_after_header=True, raise_on_status=False
+)
+_tmdb_session = requests.Session()
+_tmdb_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=_tmdb_retry))
+
 
 def _tmdb_request(endpoint: str, api_key: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
     if not api_key:
@@ -33,7 +45,7 @@ def _tmdb_request(endpoint: str, api_key: str, params: Optional[Dict[str, Any]]
     try:
         proxies = config_manager.get_proxies_for_requests()
         # logger.debug(f"TMDb Request: URL={full_url}, Params={base_params}")
-        response = requests.get(full_url, params=base_params, timeout=15, proxies=proxies) # 增加超时
+        response = _tmdb_session.get(full_url, params=base_params, timeout=15, proxies=proxies) # 增加超时
         response.raise_for_status()
         data = response.json()
         return data
@@ -2,6 +2,7 @@
 
 import re
 import os
+import functools
 import psycopg2
 from datetime import datetime
 from typing import Optional, List, Dict, Any
@@ -28,16 +29,35 @@ except ImportError:
     def translators_translate_text(*args, **kwargs):
         raise NotImplementedError("translators 库未安装")
 
+# CJK 统一汉字、扩展A区、兼容汉字
+_CHINESE_CHAR_PATTERN = re.compile('[\u4e00-\u9fff\u3400-\u4dbf\uf900-\ufaff]')
+# 角色名中外对照截断时使用的基本汉字范围
+_CHINESE_BASIC_PATTERN = re.compile(r'[\u4e00-\u9fa5]')
+# 角色名清理用到的正则，模块加载时编译一次
+_ROLE_BRACKETS_PATTERN = re.compile(r'\(.*?\)|\[.*?\]|（.*?）|【.*?】')
+_ROLE_AS_PREFIX_PATTERN = re.compile(r'^(as\s+)', flags=re.IGNORECASE)
+_ROLE_PREFIX_PATTERN = re.compile(r'^((?:饰演|饰|扮演|扮|配音|配|as\b)\s*)+', flags=re.IGNORECASE)
+_ROLE_SUFFIX_PATTERN = re.compile(r'(\s*(?:饰演|饰|配音|配))+$')
+_LATIN_LETTER_PATTERN = re.compile(r'[a-zA-Z]')
+
+@functools.lru_cache(maxsize=16384)
+def _contains_chinese_cached(text: str) -> bool:
+    # 纯 ASCII（绝大多数英文名/角色名）用 C 层面的 isascii() 直接排除，无需进入正则引擎
+    if text.isascii():
+        return False
+    return _CHINESE_CHAR_PATTERN.search(text) is not None
+
 def contains_chinese(text: Optional[str]) -> bool:
-    """检查字符串是否包含中文字符。"""
+    """检查字符串是否包含中文字符。同一批演员名/角色名会被反复检查，结果按字符串缓存。"""
     if not text:
         return False
-    for char in text:
-        if '\u4e00' <= char <= '\u9fff' or \
-           '\u3400' <= char <= '\u4dbf' or \
-           '\uf900' <= char <= '\ufaff':
-            return True
-    return False
+    return _contains_chinese_cached(text)
+
+def to_stripped_str(value: Any) -> str:
+    """将任意值转为去除首尾空白的字符串，None 视为空串；已是 str 时跳过 str() 转换。"""
+    if value.__class__ is str:
+        return value.strip()
+    return "" if value is None else str(value).strip()
 
 def clean_character_name_static(character_name: Optional[str]) -> str:
     """
@@ -48,25 +68,25 @@ def clean_character_name_static(character_name: Optional[str]) -> str:
     """
     if not character_name:
         return ""
+    # 同一个角色名在一次处理中会被清理多次（匹配、翻译收集、回填、格式化），结果按字符串缓存
+    return _clean_character_name_cached(str(character_name).strip())
 
-    name = str(character_name).strip()
-
+@functools.lru_cache(maxsize=4096)
+def _clean_character_name_cached(name: str) -> str:
     # 移除括号和中括号的内容
-    name = re.sub(r'\(.*?\)|\[.*?\]|（.*?）|【.*?】', '', name).strip()
+    name = _ROLE_BRACKETS_PATTERN.sub('', name).strip()
 
     # 移除 as 前缀（如 "as Kevin"）
-    name = re.sub(r'^(as\s+)', '', name, flags=re.IGNORECASE).strip()
+    name = _ROLE_AS_PREFIX_PATTERN.sub('', name).strip()
 
     # 清理前缀中的“饰演/饰/配音/配”（不加判断，直接清理）
-    prefix_pattern = r'^((?:饰演|饰|扮演|扮|配音|配|as\b)\s*)+'
-    name = re.sub(prefix_pattern, '', name, flags=re.IGNORECASE).strip()
+    name = _ROLE_PREFIX_PATTERN.sub('', name).strip()
 
     # 清理后缀中的“饰演/饰/配音/配”
-    suffix_pattern = r'(\s*(?:饰演|饰|配音|配))+$'
-    name = re.sub(suffix_pattern, '', name).strip()
+    name = _ROLE_SUFFIX_PATTERN.sub('', name).strip()
 
     # 处理中外对照：“中文 + 英文”形式，只保留中文部分
-    match = re.search(r'[a-zA-Z]', name)
+    match = _LATIN_LETTER_PATTERN.search(name)
     if match:
         # 如果找到了英文字母，取它之前的所有内容
         first_letter_index = match.start()
@@ -74,7 +94,7 @@ def clean_character_name_static(character_name: Optional[str]) -> str:
         
         # 只有当截取出来的部分确实包含中文时，才进行截断。
         # 这可以防止 "Kevin" 这种纯英文名字被错误地清空。
-        if re.search(r'[\u4e00-\u9fa5]', chinese_part):
+        if _CHINESE_BASIC_PATTERN.search(chinese_part):
             return chinese_part
 
     # 如果只有外文，或清理后是英文，保留原值，等待后续翻译流程
@@ -159,20 +179,32 @@ class LogDBManager:
     """
     专门负责与日志相关的数据库表 (processed_log, failed_log) 进行交互的类。
     """
+    # 每个媒体项处理完都会执行的两条 upsert，SQL 文本作为类常量只构建一次
+    _SQL_UPSERT_PROCESSED = """
+        INSERT INTO processed_log (item_id, item_name, processed_at, score)
+        VALUES (%s, %s, NOW(), %s)
+        ON CONFLICT (item_id) DO UPDATE SET
+            item_name = EXCLUDED.item_name,
+            processed_at = NOW(),
+            score = EXCLUDED.score;
+    """
+    _SQL_UPSERT_FAILED = """
+        INSERT INTO failed_log (item_id, item_name, reason, item_type, score, failed_at)
+        VALUES (%s, %s, %s, %s, %s, NOW())
+        ON CONFLICT (item_id) DO UPDATE SET
+            item_name = EXCLUDED.item_name,
+            reason = EXCLUDED.reason,
+            item_type = EXCLUDED.item_type,
+            score = EXCLUDED.score,
+            failed_at = NOW();
+    """
+
     def __init__(self):
         pass
 
     def save_to_processed_log(self, cursor: psycopg2.extensions.cursor, item_id: str, item_name: str, score: float = 10.0):
         try:
-            sql = """
-                INSERT INTO processed_log (item_id, item_name, processed_at, score)
-                VALUES (%s, %s, NOW(), %s)
-                ON CONFLICT (item_id) DO UPDATE SET
-                    item_name = EXCLUDED.item_name,
-                    processed_at = NOW(),
-                    score = EXCLUDED.score;
-            """
-            cursor.execute(sql, (item_id, item_name, score))
+            cursor.execute(self._SQL_UPSERT_PROCESSED, (item_id, item_name, score))
         except Exception as e:
             logger.error(f"写入已处理 失败 (Item ID: {item_id}): {e}")
     
@@ -191,17 +223,7 @@ class LogDBManager:
 
     def save_to_failed_log(self, cursor: psycopg2.extensions.cursor, item_id: str, item_name: str, reason: str, item_type: str, score: Optional[float] = None):
         try:
-            sql = """
-                INSERT INTO failed_log (item_id, item_name, reason, item_type, score, failed_at)
-                VALUES (%s, %s, %s, %s, %s, NOW())
-                ON CONFLICT (item_id) DO UPDATE SET
-                    item_name = EXCLUDED.item_name,
-                    reason = EXCLUDED.reason,
-                    item_type = EXCLUDED.item_type,
-                    score = EXCLUDED.score,
-                    failed_at = NOW();
-            """
-            cursor.execute(sql, (item_id, item_name, reason, item_type, score))
+            cursor.execute(self._SQL_UPSERT_FAILED, (item_id, item_name, reason, item_type, score))
         except Exception as e:
             logger.error(f"写入 failed_log 失败 (Item ID: {item_id}): {e}")
     
@@ -314,6 +314,12 @@ def init_db():
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_pim_tmdb_id ON person_identity_map (tmdb_person_id)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_pim_imdb_id ON person_identity_map (imdb_id)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_pim_douban_id ON person_identity_map (douban_celebrity_id)")
+                # 部分索引：只收录"仅有豆瓣ID、待补充 IMDb"的演员，按 last_synced_at 排序，
+                # 演员数据补充任务的豆瓣阶段可以直接按索引顺序读取，无需全表扫描再排序
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_pim_douban_needy ON person_identity_map (last_synced_at NULLS FIRST)
+                    WHERE douban_celebrity_id IS NOT NULL AND imdb_id IS NULL AND tmdb_person_id IS NULL
+                """)
 
                 logger.trace("  -> 正在创建 'actor_metadata' 表...")
                 cursor.execute("""